@@ -7,11 +7,7 @@ import subprocess
 import platform
 from typing import Dict, List, Set
 
-from rich.console import Console
-from rich.panel import Panel
-from rich.text import Text
-
-console = Console()
+from strategies import signal_key
 
 _SOUND_FILE = "/System/Library/Sounds/Glass.aiff"
 
@@ -47,8 +43,7 @@ def _signal_keys(all_signals: Dict) -> Set[str]:
     keys: Set[str] = set()
     for strategy, signals in all_signals.items():
         for s in signals:
-            ticker = s.get("ticker") or s.get("event_ticker") or ""
-            keys.add(f"{strategy}:{ticker}")
+            keys.add(f"{strategy}:{signal_key(s)}")
     return keys
 
 
@@ -64,6 +59,11 @@ def check_and_fire(current: Dict, previous: Dict) -> None:
     if not new_keys:
         return
 
+    # Rich is only needed once there is something to show
+    from rich.panel import Panel
+    from rich.text import Text
+    import display
+
     _beep()
 
     lines = Text()
@@ -79,4 +79,4 @@ def check_and_fire(current: Dict, previous: Dict) -> None:
         expand=False,
     )
     # Print below the live display (will appear briefly; live will overwrite on next render)
-    console.print(panel)
+    display.get_console().print(panel)
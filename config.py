@@ -10,3 +10,33 @@ MAX_MARKETS = 200
 OB_SAMPLE_TOP_N = 30            # max orderbooks to fetch per cycle
 DATA_STORE_WINDOW = 60          # rolling window size (polls)
 LOW_VOLUME_THRESHOLD = 100      # Strategy 5: low volume cutoff
+OB_HISTORY_WINDOW = 120         # delta-encoded book updates kept per ticker
+OB_STORE_MAX_TICKERS = 500      # LRU cap on tickers held in orderbook_store
+STREAM_ADDRESS = "127.0.0.1:8765"  # streaming feed host:port (see stream_server.py)
+STREAM_BOOK_TICKERS = 50        # max order books subscribed in streaming mode
+STREAM_MIN_EVAL_SECS = 0.25     # min gap between strategy runs on stream changes
+STREAM_IDLE_SECS = 1.0          # socket read timeout before yielding an idle tick
+STREAM_RECONNECT_SECS = 5       # backoff before resubscribing after a drop
+ENABLED_STRATEGIES = [          # strategies run by the engine (see strategies/)
+    "spread_arb",
+    "correlated_arb",
+    "order_book",
+    "market_maker",
+    "mean_reversion",
+    "theta",
+]
+DATA_STORE_EVICT_AFTER_POLLS = 30          # drop tickers unseen for this many polls
+DATA_STORE_MAX_BYTES = 32 * 1024 * 1024   # estimated memory budget (LRU beyond this)
+TIERED_POLLING = False          # monitor --tiered: hot/warm/cold refresh rates
+POLL_HOT_SECS = 2               # tiered: hot market refresh interval (get_market)
+POLL_WARM_SECS = 10             # tiered: warm market refresh interval (get_market)
+POLL_BULK_SECS = 30             # tiered: bulk get_markets + order book sample interval
+POLL_REQUEST_BUDGET = None      # tiered: req/s; None = what plain polling would use
+SCHED_NEAR_CENTS = 3            # tiered: "near a signal threshold" margin
+SCHED_MOVE_CENTS = 3            # tiered: price move over the history window
+SCHED_ACTIVE_VOLUME = 1000      # tiered: volume that counts as active
+CORRELATED_ARB_TOP_K = 50       # Strategy 2: events reported, by largest mispricing
+FANOUT_ADDRESS = "127.0.0.1:8770"  # signal publisher: host:port or unix:/path
+FANOUT_QUEUE_FRAMES = 64        # frames buffered per subscriber before it is dropped
+JOURNAL_PATH = "signals.db"     # default SQLite signal journal (--journal)
+JOURNAL_BUSY_SECS = 10.0        # wait this long for another writer's lock on the journal
@@ -1,26 +1,181 @@
-"""In-memory rolling time-series store for per-ticker price history."""
+"""
+In-memory rolling time-series store for per-ticker price history.
 
-from collections import deque
-from datetime import datetime
+Tickers are evicted once they go DATA_STORE_EVICT_AFTER_POLLS polls without
+appearing, once their close time has passed, and least-recently-seen first
+whenever the estimated footprint exceeds DATA_STORE_MAX_BYTES.
+"""
+
+import heapq
+import sys
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
 from typing import Dict, List, Optional, Tuple
 import config
 
-# { ticker: deque([(timestamp, yes_ask, volume), ...], maxlen=WINDOW) }
-_store: Dict[str, deque] = {}
+# { ticker: deque([(timestamp, yes_ask, volume), ...], maxlen=WINDOW) },
+# least recently seen first
+_store: "OrderedDict[str, deque]" = OrderedDict()
+# { ticker: poll number it was last seen on }
+_last_seen: Dict[str, int] = {}
+# { ticker: (close_time string, parsed close time) }
+_close: Dict[str, Tuple[str, datetime]] = {}
+# min-heap of (close time, ticker); entries are checked against _close
+_close_heap: List[Tuple[datetime, str]] = []
+_poll = 0
+_samples = 0
+# Samples kept per ticker; resize() sets it from the strategies' declared depth
+_window = config.DATA_STORE_WINDOW
+
+# Estimated footprint. Timestamps are shared by every sample in a poll, so a
+# sample costs its tuple plus a deque slot; a ticker costs its deque, key and
+# bookkeeping entries.
+_SAMPLE_BYTES = sys.getsizeof((0, 0, 0)) + 8
+_TICKER_BYTES = sys.getsizeof(deque(maxlen=1)) + 4 * 100
+
+
+def parse_time(dt_str: str) -> datetime:
+    """Parse ISO-8601 datetime string to a timezone-aware datetime."""
+    if not dt_str:
+        raise ValueError("empty datetime string")
+    # Handle various formats from the API
+    for fmt in (
+        "%Y-%m-%dT%H:%M:%SZ",
+        "%Y-%m-%dT%H:%M:%S.%fZ",
+        "%Y-%m-%dT%H:%M:%S+00:00",
+        "%Y-%m-%dT%H:%M:%S",
+    ):
+        try:
+            dt = datetime.strptime(dt_str, fmt)
+            return dt.replace(tzinfo=timezone.utc)
+        except ValueError:
+            continue
+    raise ValueError(f"Cannot parse datetime: {dt_str!r}")
+
+
+def _close_time(ticker: str, close_str: Optional[str]) -> Optional[datetime]:
+    """Return a ticker's parsed close time, parsing only when it changes."""
+    if not close_str:
+        return None
+    known = _close.get(ticker)
+    if known and known[0] == close_str:
+        return known[1]
+    try:
+        close_dt = parse_time(close_str)
+    except ValueError:
+        return None
+    _close[ticker] = (close_str, close_dt)
+    heapq.heappush(_close_heap, (close_dt, ticker))
+    return close_dt
+
+
+def _remove(ticker: str) -> None:
+    global _samples
+    buf = _store.pop(ticker, None)
+    if buf is not None:
+        _samples -= len(buf)
+    _last_seen.pop(ticker, None)
+    _close.pop(ticker, None)
+
+
+def estimated_bytes() -> int:
+    return len(_store) * _TICKER_BYTES + _samples * _SAMPLE_BYTES
+
 
+def resize(window: int) -> None:
+    """Keep `window` samples per ticker, trimming existing history if it shrinks."""
+    global _window, _samples
+    if window == _window:
+        return
+    _window = window
+    for ticker, buf in _store.items():
+        _store[ticker] = deque(buf, maxlen=window)
+    _samples = sum(len(buf) for buf in _store.values())
 
-def update(markets: List[dict]) -> None:
-    """Ingest the latest poll snapshot for all markets."""
-    ts = datetime.utcnow()
+
+def evict(now: Optional[datetime] = None) -> List[str]:
+    """
+    Drop stale, closed (as of `now`, default the wall clock) and (over
+    budget) least-recently-seen tickers. Returns the evicted tickers.
+    """
+    evicted: List[str] = []
+
+    # Not seen for K polls: _store is in last-seen order, so stop at the first fresh one
+    cutoff = _poll - config.DATA_STORE_EVICT_AFTER_POLLS
+    for ticker in _store:
+        if _last_seen[ticker] > cutoff:
+            break
+        evicted.append(ticker)
+    for ticker in evicted:
+        _remove(ticker)
+
+    # Close time passed
+    now = now or datetime.now(timezone.utc)
+    while _close_heap and _close_heap[0][0] <= now:
+        close_dt, ticker = heapq.heappop(_close_heap)
+        known = _close.get(ticker)
+        if not known or known[1] != close_dt:
+            continue
+        if ticker in _store:
+            evicted.append(ticker)
+        _remove(ticker)
+
+    # Memory budget: LRU
+    while _store and estimated_bytes() > config.DATA_STORE_MAX_BYTES:
+        ticker = next(iter(_store))
+        _remove(ticker)
+        evicted.append(ticker)
+
+    # Heap entries for evicted/re-dated tickers are dead; compact when mostly dead
+    if len(_close_heap) > 2 * len(_close) + 64:
+        _close_heap[:] = [(dt, t) for t, (_, dt) in _close.items()]
+        heapq.heapify(_close_heap)
+
+    return evicted
+
+
+def update(markets: List[dict], now: Optional[datetime] = None) -> List[str]:
+    """
+    Ingest the latest poll snapshot for all markets, then evict.
+    `now` (timezone-aware) is the snapshot's time, used for the samples and
+    for close-time checks; replay passes the recorded time so markets that
+    have since closed still count as open. Defaults to the wall clock.
+    Returns the tickers evicted on this poll.
+    """
+    global _poll, _samples
+    _poll += 1
+    now = now or datetime.now(timezone.utc)
+    ts = now.replace(tzinfo=None)
     for m in markets:
         ticker = m.get("ticker")
         if not ticker:
             continue
+        close_dt = _close_time(ticker, m.get("close_time") or m.get("expiration_time"))
+        if close_dt is not None and close_dt <= now:
+            continue  # closed but still listed; evict() drops any history
         yes_ask = m.get("yes_ask") or m.get("last_price") or 0
         volume = m.get("volume") or m.get("volume_24h") or 0
-        if ticker not in _store:
-            _store[ticker] = deque(maxlen=config.DATA_STORE_WINDOW)
-        _store[ticker].append((ts, yes_ask, volume))
+        buf = _store.get(ticker)
+        if buf is None:
+            buf = _store[ticker] = deque(maxlen=_window)
+        else:
+            _store.move_to_end(ticker)
+        if len(buf) < buf.maxlen:
+            _samples += 1
+        buf.append((ts, yes_ask, volume))
+        _last_seen[ticker] = _poll
+    return evict(now)
+
+
+def memory_usage() -> Dict[str, int]:
+    """Report store size against the configured budget."""
+    return {
+        "tickers": len(_store),
+        "samples": _samples,
+        "estimated_bytes": estimated_bytes(),
+        "budget_bytes": config.DATA_STORE_MAX_BYTES,
+        "polls": _poll,
+    }
 
 
 def get_history(ticker: str) -> List[Tuple[datetime, int, int]]:
@@ -45,4 +200,10 @@ def oldest(ticker: str) -> Optional[Tuple[datetime, int, int]]:
 
 
 def clear() -> None:
+    global _poll, _samples
     _store.clear()
+    _last_seen.clear()
+    _close.clear()
+    _close_heap.clear()
+    _poll = 0
+    _samples = 0
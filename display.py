@@ -12,10 +12,18 @@ from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
 
-console = Console()
+_console: Console = None
 _live: Live = None
 
 
+def get_console() -> Console:
+    """Return the shared dashboard console, creating it on first use."""
+    global _console
+    if _console is None:
+        _console = Console()
+    return _console
+
+
 def _make_spread_arb_table(signals: List[Dict]) -> Table:
     t = Table(title="S1: Spread Arb", expand=True, show_lines=False)
     t.add_column("Ticker", style="cyan", no_wrap=True, max_width=22)
@@ -41,15 +49,17 @@ def _make_correlated_arb_table(signals: List[Dict]) -> Table:
     t.add_column("Easier", justify="right")
     t.add_column("Harder", justify="right")
     t.add_column("Misprice", justify="right")
+    t.add_column("Inv.", justify="right")
     for s in signals[:8]:
         t.add_row(
             s["event_ticker"][:18],
             f"{s['easier_yes_ask']}¢",
             Text(f"{s['harder_yes_ask']}¢", style="yellow"),
             Text(f"+{s['mispricing_cents']}¢", style="green"),
+            str(s.get("inversions", 1)),
         )
     if not signals:
-        t.add_row("[dim]no signals[/dim]", "", "", "")
+        t.add_row("[dim]no signals[/dim]", "", "", "", "")
     return t
 
 
@@ -176,7 +186,7 @@ def build_layout(all_signals: Dict, market_count: int) -> Layout:
 
 def start_live() -> Live:
     global _live
-    _live = Live(console=console, refresh_per_second=1, screen=True)
+    _live = Live(console=get_console(), refresh_per_second=1, screen=True)
     _live.start()
     return _live
 
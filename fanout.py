@@ -0,0 +1,213 @@
+"""
+Signal fan-out — one monitor publishes, any number of local subscribers render.
+
+Frames are newline-delimited JSON over a Unix ("unix:/path") or TCP
+("host:port") socket:
+  {"type": "snapshot", "seq": n, "ts": t, "market_count": c, "signals": {...}}
+      sent once to each subscriber on connect
+  {"type": "delta", "seq": n, "ts": t, "market_count": c, "changes": {
+      strategy: {"upsert": [signal, ...], "remove": [key, ...], "order": [key, ...]}}}
+      sent every cycle; strategies with no changes are omitted, "order" only
+      when the ranking changed
+
+Signals are keyed per strategy by strategies.signal_key().
+
+Each subscriber has its own writer thread fed by a FANOUT_QUEUE_FRAMES-deep
+queue, so publish() never blocks on a socket; a subscriber that falls that
+far behind is disconnected and resyncs from a snapshot when it reconnects.
+"""
+
+import json
+import os
+import queue
+import socket
+import threading
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+import config
+from strategies import signal_key
+
+
+def _family_and_target(address: str) -> Tuple[int, object]:
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:"):]
+    host, _, port = address.rpartition(":")
+    return socket.AF_INET, (host or "127.0.0.1", int(port))
+
+
+def _encode(frame: Dict) -> bytes:
+    return json.dumps(frame, separators=(",", ":")).encode() + b"\n"
+
+
+def _index(all_signals: Dict) -> Dict[str, Dict[str, Dict]]:
+    """{strategy: {key: signal}} preserving each strategy's ranking."""
+    return {
+        strategy: {signal_key(s): s for s in signals}
+        for strategy, signals in all_signals.items()
+    }
+
+
+def diff(prev: Dict[str, Dict[str, Dict]], curr: Dict[str, Dict[str, Dict]]) -> Dict:
+    """Per-strategy upserts, removals and new ordering between two indexes."""
+    changes: Dict[str, Dict] = {}
+    for strategy in prev.keys() | curr.keys():
+        old = prev.get(strategy, {})
+        new = curr.get(strategy, {})
+        change: Dict[str, List] = {}
+        upsert = [s for k, s in new.items() if old.get(k) != s]
+        remove = [k for k in old if k not in new]
+        if upsert:
+            change["upsert"] = upsert
+        if remove:
+            change["remove"] = remove
+        if list(old) != list(new):
+            change["order"] = list(new)
+        if change:
+            changes[strategy] = change
+    return changes
+
+
+class Publisher:
+    """Serves signal snapshots and deltas to local subscribers."""
+
+    def __init__(self, address: str = config.FANOUT_ADDRESS) -> None:
+        self.address = address
+        self.lock = threading.Lock()
+        # { subscriber socket: its outbound frame queue }
+        self.clients: Dict[socket.socket, "queue.Queue[bytes]"] = {}
+        self.state: Dict[str, Dict[str, Dict]] = {}
+        self.market_count = 0
+        self.seq = 0
+        self._sock: Optional[socket.socket] = None
+
+    def start(self) -> "Publisher":
+        family, target = _family_and_target(self.address)
+        if family == socket.AF_UNIX and os.path.exists(target):
+            os.unlink(target)
+        self._sock = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self._sock.bind(target)
+        self._sock.listen()
+        threading.Thread(target=self._accept, daemon=True).start()
+        return self
+
+    def _snapshot(self) -> Dict:
+        return {
+            "type": "snapshot",
+            "seq": self.seq,
+            "ts": time.time(),
+            "market_count": self.market_count,
+            "signals": {k: list(v.values()) for k, v in self.state.items()},
+        }
+
+    def _accept(self) -> None:
+        while True:
+            try:
+                conn, _ = self._sock.accept()
+            except OSError:
+                return
+            frames: "queue.Queue[bytes]" = queue.Queue(maxsize=config.FANOUT_QUEUE_FRAMES)
+            with self.lock:
+                frames.put_nowait(_encode(self._snapshot()))
+                self.clients[conn] = frames
+            threading.Thread(target=self._write, args=(conn, frames), daemon=True).start()
+
+    def _write(self, conn: socket.socket, frames: "queue.Queue[bytes]") -> None:
+        """Drain one subscriber's queue; exits when the socket fails or is kicked."""
+        try:
+            while True:
+                frame = frames.get()
+                if not frame:
+                    break
+                conn.sendall(frame)
+        except OSError:
+            pass
+        finally:
+            with self.lock:
+                self.clients.pop(conn, None)
+            conn.close()
+
+    @staticmethod
+    def _kick(conn: socket.socket, frames: "queue.Queue[bytes]") -> None:
+        # Wakes the writer (blocked on an empty queue or in sendall); it
+        # closes the socket on its way out
+        try:
+            frames.put_nowait(b"")
+        except queue.Full:
+            pass
+        try:
+            conn.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+
+    def publish(self, all_signals: Dict, market_count: int) -> None:
+        """Queue this cycle's changes for every subscriber."""
+        curr = _index(all_signals)
+        with self.lock:
+            self.seq += 1
+            frame = _encode({
+                "type": "delta",
+                "seq": self.seq,
+                "ts": time.time(),
+                "market_count": market_count,
+                "changes": diff(self.state, curr),
+            })
+            self.state = curr
+            self.market_count = market_count
+
+            for conn, frames in list(self.clients.items()):
+                try:
+                    frames.put_nowait(frame)
+                except queue.Full:
+                    # Too far behind; it resyncs from a snapshot on reconnect
+                    del self.clients[conn]
+                    self._kick(conn, frames)
+
+    def close(self) -> None:
+        with self.lock:
+            for conn, frames in self.clients.items():
+                self._kick(conn, frames)
+            self.clients = {}
+        if self._sock is not None:
+            try:
+                self._sock.shutdown(socket.SHUT_RDWR)  # wakes the accept thread
+            except OSError:
+                pass
+            self._sock.close()
+            family, target = _family_and_target(self.address)
+            if family == socket.AF_UNIX and os.path.exists(target):
+                os.unlink(target)
+
+
+def subscribe(address: str = config.FANOUT_ADDRESS) -> Iterator[Tuple[Dict, int]]:
+    """
+    Connect to a publisher and yield (all_signals, market_count) after every
+    frame. Raises ConnectionError if the publisher goes away or a frame is
+    missed.
+    """
+    family, target = _family_and_target(address)
+    with socket.socket(family, socket.SOCK_STREAM) as sock:
+        sock.connect(target)
+        state: Dict[str, Dict[str, Dict]] = {}
+        seq = None
+        for line in sock.makefile("rb"):
+            if not line.endswith(b"\n"):
+                break  # cut off mid-frame
+            frame = json.loads(line)
+            if frame["type"] == "snapshot":
+                state = _index(frame["signals"])
+            else:
+                if seq is not None and frame["seq"] != seq + 1:
+                    raise ConnectionError(f"missed frame: expected {seq + 1}, got {frame['seq']}")
+                for strategy, change in frame["changes"].items():
+                    signals = state.setdefault(strategy, {})
+                    for key in change.get("remove", ()):
+                        signals.pop(key, None)
+                    for s in change.get("upsert", ()):
+                        signals[signal_key(s)] = s
+                    if "order" in change:
+                        state[strategy] = {k: signals[k] for k in change["order"]}
+            seq = frame["seq"]
+            yield {k: list(v.values()) for k, v in state.items()}, frame["market_count"]
+    raise ConnectionError("publisher closed the feed")
@@ -0,0 +1,256 @@
+"""
+Persistent signal journal (SQLite).
+
+Rather than rewriting every signal every cycle, the journal records each
+(strategy, key) signal's lifecycle:
+  open   first cycle the signal appears
+  peak   its score exceeds the previous peak (e.g. spread arb got wider)
+  close  first cycle it is gone
+A cycle's events are written in a single transaction; unchanged signals cost
+only an in-memory dict lookup. Open signals are reloaded on startup so
+lifecycles continue across restarts (and across one-shot `scan` runs).
+Several processes (a monitor and a cron `scan`, say) can journal to the same
+file: each cycle's writes run under BEGIN IMMEDIATE, the open-signal cache is
+reloaded whenever another process has committed, and a partial unique index
+keeps one open row per (strategy, key).
+"""
+
+import json
+import sqlite3
+import time
+from typing import Callable, Dict, List, Optional, Set, Tuple
+import config
+from strategies import signal_key
+
+# How "big" a signal is, per strategy; peaks are tracked on this
+_SCORES: Dict[str, Callable[[Dict], float]] = {
+    "spread_arb": lambda s: s["net_profit_est"],
+    "correlated_arb": lambda s: s["mispricing_cents"],
+    "order_book": lambda s: abs(s["imbalance"] - 0.5),
+    "market_maker": lambda s: s["spread"],
+    "mean_reversion": lambda s: abs(s["price_delta"]),
+    "theta": lambda s: s["yes_ask"],
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS signals (
+    id          INTEGER PRIMARY KEY,
+    strategy    TEXT NOT NULL,
+    ticker      TEXT NOT NULL,
+    opened_at   REAL NOT NULL,
+    closed_at   REAL,
+    peak_score  REAL NOT NULL,
+    peak_at     REAL NOT NULL,
+    payload     TEXT NOT NULL,
+    peak_payload TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS signals_ticker_time ON signals (ticker, opened_at);
+CREATE INDEX IF NOT EXISTS signals_strategy_time ON signals (strategy, opened_at);
+CREATE INDEX IF NOT EXISTS signals_time ON signals (opened_at);
+CREATE INDEX IF NOT EXISTS signals_open ON signals (closed_at) WHERE closed_at IS NULL;
+-- At most one open row per signal; journals written before this index could
+-- hold duplicates, so keep the newest and close the rest first
+UPDATE signals SET closed_at = peak_at
+WHERE closed_at IS NULL AND id NOT IN (
+    SELECT MAX(id) FROM signals WHERE closed_at IS NULL GROUP BY strategy, ticker
+);
+CREATE UNIQUE INDEX IF NOT EXISTS signals_open_key ON signals (strategy, ticker)
+    WHERE closed_at IS NULL;
+
+CREATE TABLE IF NOT EXISTS events (
+    signal_id   INTEGER NOT NULL REFERENCES signals (id),
+    ts          REAL NOT NULL,
+    kind        TEXT NOT NULL,
+    score       REAL
+);
+CREATE INDEX IF NOT EXISTS events_signal ON events (signal_id, ts);
+CREATE INDEX IF NOT EXISTS events_time ON events (ts);
+"""
+
+
+def _score(strategy: str, signal: Dict) -> float:
+    fn = _SCORES.get(strategy)
+    try:
+        return float(fn(signal)) if fn else 0.0
+    except (KeyError, TypeError):
+        return 0.0
+
+
+class Journal:
+    def __init__(self, path: str) -> None:
+        # Autocommit; record() manages its own transaction
+        self.conn = sqlite3.connect(path, timeout=config.JOURNAL_BUSY_SECS, isolation_level=None)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.executescript(_SCHEMA)
+
+        # { (strategy, key): [signal id, peak score] } for open signals, as of
+        # data_version _version (which only moves when another connection commits)
+        self._version = self._data_version()
+        self._open = self._load_open()
+
+    def _data_version(self) -> int:
+        return self.conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _load_open(self) -> Dict[Tuple[str, str], List]:
+        return {
+            (row["strategy"], row["ticker"]): [row["id"], row["peak_score"]]
+            for row in self.conn.execute(
+                "SELECT id, strategy, ticker, peak_score FROM signals WHERE closed_at IS NULL"
+            )
+        }
+
+    @staticmethod
+    def _plan(
+        open_signals: Dict[Tuple[str, str], List],
+        all_signals: Dict,
+        covered: Dict[str, Set[str]],
+    ) -> Tuple[List[Tuple], List[Tuple], List[Tuple]]:
+        """Opens and peaks as (key, score, payload), closes as keys."""
+        seen = set()
+        opens: List[Tuple] = []
+        peaks: List[Tuple] = []
+        for strategy, signals in all_signals.items():
+            for s in signals:
+                key = (strategy, signal_key(s))
+                if key in seen:
+                    continue
+                seen.add(key)
+                score = _score(strategy, s)
+                state = open_signals.get(key)
+                if state is None:
+                    opens.append((key, score, json.dumps(s, separators=(",", ":"))))
+                elif score > state[1]:
+                    peaks.append((key, score, json.dumps(s, separators=(",", ":"))))
+
+        # Only strategies that ran this cycle can close signals, and only for
+        # keys they looked at
+        closes = [
+            key for key in open_signals
+            if key[0] in all_signals and key not in seen
+            and (key[0] not in covered or key[1] in covered[key[0]])
+        ]
+        return opens, peaks, closes
+
+    def record(
+        self,
+        all_signals: Dict,
+        ts: Optional[float] = None,
+        covered: Optional[Dict[str, Set[str]]] = None,
+    ) -> Dict[str, int]:
+        """
+        Journal one cycle of signals from every strategy.
+        covered limits, per strategy, which keys were evaluated this cycle
+        (e.g. the sampled order books); signals outside it stay open.
+        Returns counts of opened, peaked and closed signals.
+        """
+        ts = time.time() if ts is None else ts
+        covered = covered or {}
+        opens, peaks, closes = self._plan(self._open, all_signals, covered)
+        if not (opens or peaks or closes) and self._data_version() == self._version:
+            return {"opened": 0, "peaked": 0, "closed": 0}
+
+        self.conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have opened, peaked or closed signals since
+            # we last looked; plan against the database, not our cache
+            version = self._data_version()
+            state = self._open
+            if version != self._version:
+                state = self._load_open()
+                opens, peaks, closes = self._plan(state, all_signals, covered)
+
+            events: List[Tuple] = []
+            opened = 0
+            for key, score, payload in opens:
+                row = self.conn.execute(
+                    "INSERT INTO signals (strategy, ticker, opened_at, peak_score,"
+                    " peak_at, payload, peak_payload) VALUES (?, ?, ?, ?, ?, ?, ?)"
+                    " ON CONFLICT (strategy, ticker) WHERE closed_at IS NULL DO NOTHING"
+                    " RETURNING id",
+                    (key[0], key[1], ts, score, ts, payload, payload),
+                ).fetchone()
+                if row is not None:
+                    opened += 1
+                    events.append((row[0], ts, "open", score))
+            self.conn.executemany(
+                "UPDATE signals SET peak_score = ?, peak_at = ?, peak_payload = ?"
+                " WHERE id = ?",
+                [(score, ts, payload, state[key][0]) for key, score, payload in peaks],
+            )
+            events.extend((state[key][0], ts, "peak", score) for key, score, _ in peaks)
+            self.conn.executemany(
+                "UPDATE signals SET closed_at = ? WHERE id = ?",
+                [(ts, state[key][0]) for key in closes],
+            )
+            events.extend((state[key][0], ts, "close", None) for key in closes)
+            self.conn.executemany(
+                "INSERT INTO events (signal_id, ts, kind, score) VALUES (?, ?, ?, ?)",
+                events,
+            )
+            open_signals = self._load_open()
+            self.conn.execute("COMMIT")
+        except BaseException:
+            self.conn.execute("ROLLBACK")
+            raise
+
+        # Only touched once the transaction commits, so a failed write leaves
+        # the cache matching the database
+        self._open = open_signals
+        self._version = version
+        return {"opened": opened, "peaked": len(peaks), "closed": len(closes)}
+
+    def history(
+        self,
+        ticker: Optional[str] = None,
+        strategy: Optional[str] = None,
+        since: Optional[float] = None,
+        until: Optional[float] = None,
+        active: bool = False,
+        limit: int = 1000,
+    ) -> List[Dict]:
+        """
+        Signals matching the filters, newest first. since/until bound the
+        open time (epoch seconds); active limits to still-open signals.
+        """
+        clauses, params = [], []
+        if ticker is not None:
+            clauses.append("ticker = ?")
+            params.append(ticker)
+        if strategy is not None:
+            clauses.append("strategy = ?")
+            params.append(strategy)
+        if since is not None:
+            clauses.append("opened_at >= ?")
+            params.append(since)
+        if until is not None:
+            clauses.append("opened_at < ?")
+            params.append(until)
+        if active:
+            clauses.append("closed_at IS NULL")
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = self.conn.execute(
+            f"SELECT * FROM signals {where} ORDER BY opened_at DESC LIMIT ?",
+            (*params, limit),
+        )
+        out = []
+        for row in rows:
+            rec = dict(row)
+            rec["payload"] = json.loads(rec["payload"])
+            rec["peak_payload"] = json.loads(rec["peak_payload"])
+            end = rec["closed_at"] if rec["closed_at"] is not None else time.time()
+            rec["duration_secs"] = round(end - rec["opened_at"], 3)
+            out.append(rec)
+        return out
+
+    def events(self, signal_id: int) -> List[Dict]:
+        """Lifecycle events for one signal, oldest first."""
+        rows = self.conn.execute(
+            "SELECT ts, kind, score FROM events WHERE signal_id = ? ORDER BY ts",
+            (signal_id,),
+        )
+        return [dict(row) for row in rows]
+
+    def close(self) -> None:
+        self.conn.close()
@@ -1,7 +1,9 @@
-"""Thin HTTP wrapper for the Kalshi public REST API."""
+"""Thin HTTP wrapper for the Kalshi public REST API, plus a streaming feed reader."""
 
+import json
+import socket
 import requests
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 import config
 
 
@@ -60,3 +62,46 @@ class KalshiClient:
         """Fetch events."""
         data = self._get("/events", params={"limit": limit, "status": status})
         return data.get("events", [])
+
+    def stream(
+        self,
+        market_tickers: Iterable[str],
+        book_tickers: Optional[Iterable[str]] = None,
+        address: str = config.STREAM_ADDRESS,
+    ) -> Iterator[Optional[Dict]]:
+        """
+        Subscribe to the ticker channel (and orderbook_delta for book_tickers)
+        and yield each feed message as a dict.
+        Messages are newline-delimited JSON using the Kalshi websocket shapes.
+        Yields None whenever the feed is idle for STREAM_IDLE_SECS.
+        Raises ConnectionError when the server closes the feed.
+        """
+        host, _, port = address.rpartition(":")
+        subscriptions = [("ticker", list(market_tickers))]
+        if book_tickers:
+            subscriptions.append(("orderbook_delta", list(book_tickers)))
+
+        with socket.create_connection((host, int(port)), timeout=10) as sock:
+            for cmd_id, (channel, tickers) in enumerate(subscriptions, 1):
+                cmd = {
+                    "id": cmd_id,
+                    "cmd": "subscribe",
+                    "params": {"channels": [channel], "market_tickers": tickers},
+                }
+                sock.sendall(json.dumps(cmd).encode() + b"\n")
+
+            sock.settimeout(config.STREAM_IDLE_SECS)
+            buf = b""
+            while True:
+                try:
+                    chunk = sock.recv(65536)
+                except socket.timeout:
+                    yield None
+                    continue
+                if not chunk:
+                    raise ConnectionError("stream closed by server")
+                buf += chunk
+                *lines, buf = buf.split(b"\n")
+                for line in lines:
+                    if line.strip():
+                        yield json.loads(line)
@@ -1,81 +1,246 @@
 """
 Kalshi Prediction Monitor — main entry point.
 
+Subcommands (default: monitor):
+  monitor   Rich live dashboard, polling or --stream
+  scan      one-shot: fetch, run strategies, print JSON signals, exit
+  replay    run strategies over snapshots captured with --record
+  bench     time the strategy pipeline on synthetic markets
+  journal   query signal lifecycles recorded with --journal
+  subscribe dashboard/alerts fed by a `monitor --publish` process, no API calls
+  soak      run the loop over rotating synthetic markets, assert memory plateaus
+
 Polling loop:
   1. Fetch active markets
-  2. Fetch order books for a sample of tickers
+  2. Fetch order books for a sample of tickers (ingested into orderbook_store)
   3. Update data store (rolling price history)
-  4. Run all 6 strategies
+  4. Run the enabled strategies (config.ENABLED_STRATEGIES / --strategies)
   5. Render Rich live dashboard
   6. Fire alerts on new signals
   7. Sleep POLL_INTERVAL_SECS and repeat
+
+Streaming mode (monitor --stream) replaces steps 1-2 and 7: markets are
+seeded over REST, then ticker and order-book deltas arrive over the feed at
+STREAM_ADDRESS and strategies re-run as soon as state changes.
+
+Tiered mode (monitor --tiered) runs the bulk listing every POLL_BULK_SECS
+and spends the rest of the request budget refreshing hot/warm markets via
+get_market (see scheduler.py).
+
+Each strategy declares its inputs (strategies.Inputs); order books and
+price history are only fetched/maintained when an enabled strategy reads
+them, and event grouping is computed once and shared.
+
+Rich, requests and the strategy modules are imported only by the commands
+that need them, so scan/replay/bench start fast and run without a TTY.
 """
 
-import time
-import sys
+import argparse
+import json
 import random
-from typing import Dict, List
+import sys
+import time
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
 
 import config
 import data_store
-import display
-import alerts
-from kalshi_client import KalshiClient
-from strategies import (
-    spread_arb,
-    correlated_arb,
-    order_book,
-    market_maker,
-    mean_reversion,
-    theta,
-)
+import market_state
+import orderbook_store
+import strategies
+
+if TYPE_CHECKING:
+    from fanout import Publisher
+    from journal import Journal
+    from kalshi_client import KalshiClient
+
+# Set by --publish / --journal; every loop hands its signals to them
+_publisher: Optional["Publisher"] = None
+_journal: Optional["Journal"] = None
 
 
 def run_all_strategies(
     markets: List[Dict],
     orderbooks: Dict[str, Dict],
+    names: Optional[List[str]] = None,
 ) -> Dict:
-    return {
-        "spread_arb": spread_arb(markets),
-        "correlated_arb": correlated_arb(markets),
-        "order_book": order_book(markets, orderbooks=orderbooks),
-        "market_maker": market_maker(markets),
-        "mean_reversion": mean_reversion(markets),
-        "theta": theta(markets),
+    """Run the enabled strategies, building shared inputs once."""
+    names = strategies.enabled(names)
+    needs = strategies.requirements(names)
+    inputs: Dict = {"orderbooks": orderbooks}
+    if needs.events:
+        inputs["events"] = strategies.group_by_event(markets)
+    return {name: strategies.get(name)(markets, **inputs) for name in names}
+
+
+def _record(path: Optional[str], markets: List[Dict], orderbooks: Dict[str, Dict]) -> None:
+    """Append one poll snapshot as a JSON line for later replay."""
+    if not path:
+        return
+    with open(path, "a") as fh:
+        fh.write(json.dumps({
+            "ts": time.time(),
+            "markets": markets,
+            "orderbooks": orderbooks,
+        }) + "\n")
+
+
+def _poll(
+    client: "KalshiClient", history: bool = True
+) -> Tuple[List[Dict], Dict[str, Dict]]:
+    """
+    Steps 1-3: fetch markets and the inputs enabled strategies need.
+    history=False leaves the data_store update to the caller.
+    """
+    needs = strategies.requirements()
+
+    # --- 1. Fetch markets ---
+    markets = client.get_markets(limit=config.MAX_MARKETS, status="active")
+
+    # --- 2. Fetch order books (sample to limit API calls) ---
+    orderbooks: Dict[str, Dict] = {}
+    if needs.orderbooks:
+        tickers = [m["ticker"] for m in markets if m.get("ticker")]
+        sample = random.sample(
+            tickers, min(config.OB_SAMPLE_TOP_N, len(tickers))
+        )
+        for ticker in sample:
+            try:
+                orderbooks[ticker] = client.get_orderbook(ticker)
+            except Exception:
+                continue
+            orderbook_store.update(ticker, orderbooks[ticker])
+
+    # --- 3. Update rolling data store ---
+    if history and needs.history:
+        orderbook_store.drop(data_store.update(markets))
+    return markets, orderbooks
+
+
+def _publish(signals: Dict, market_count: int) -> None:
+    """Send a cycle's signals to --publish subscribers."""
+    if _publisher is not None:
+        _publisher.publish(signals, market_count)
+
+
+def _journal_signals(
+    signals: Dict,
+    orderbooks: Dict[str, Optional[Dict]],
+    log: Optional[Callable[[str], None]] = None,
+) -> None:
+    """
+    Record a cycle's signals in the --journal. Order-book strategies only
+    saw this cycle's sampled books, so only those tickers' signals can
+    close. Errors (e.g. the file stays locked) are logged via `log`
+    (default stderr) so the loop keeps running.
+    """
+    if _journal is None:
+        return
+    import sqlite3
+
+    covered = {
+        name: set(orderbooks)
+        for name in signals if strategies.requirements([name]).orderbooks
     }
+    try:
+        _journal.record(signals, covered=covered)
+    except sqlite3.Error as exc:
+        msg = f"Journal write failed: {exc}"
+        if log is not None:
+            log(msg)
+        else:
+            print(msg, file=sys.stderr)
+
+
+def _resync(client: "KalshiClient") -> List[str]:
+    """Reload market state over REST. Returns the tickers to subscribe to."""
+    markets = client.get_markets(limit=config.MAX_MARKETS, status="active")
+    market_state.load(markets)
+    return [m["ticker"] for m in markets if m.get("ticker")]
 
 
-def main() -> None:
-    client = KalshiClient()
+def run_stream(client: "KalshiClient") -> None:
+    """Event-driven loop: apply feed deltas and re-run strategies on change."""
+    import alerts
+    import display
+
+    needs = strategies.requirements()
     prev_signals: Dict = {}
+    last_eval = 0.0
+    last_history = 0.0
 
-    live = display.start_live()
+    display.start_live()
 
     try:
         while True:
-            # --- 1. Fetch markets ---
+            # --- Seed state over REST, then subscribe ---
             try:
-                markets = client.get_markets(
-                    limit=config.MAX_MARKETS, status="active"
+                tickers = _resync(client)
+                dirty = True
+                feed = client.stream(
+                    tickers,
+                    book_tickers=(
+                        tickers[:config.STREAM_BOOK_TICKERS] if needs.orderbooks else None
+                    ),
+                    address=config.STREAM_ADDRESS,
                 )
+                for message in feed:
+                    if message is not None:
+                        dirty = market_state.apply(message) or dirty
+
+                    now = time.monotonic()
+                    if not dirty or now - last_eval < config.STREAM_MIN_EVAL_SECS:
+                        continue
+
+                    markets = market_state.markets()
+                    # History keeps its per-poll cadence so windows match polling mode
+                    if needs.history and now - last_history >= config.POLL_INTERVAL_SECS:
+                        orderbook_store.drop(data_store.update(markets))
+                        last_history = now
+
+                    # Books are already live in orderbook_store; pass tickers only
+                    orderbooks = dict.fromkeys(market_state.book_tickers())
+                    signals = run_all_strategies(markets, orderbooks)
+                    display.render(signals, market_count=len(markets))
+                    _publish(signals, len(markets))
+                    _journal_signals(signals, orderbooks, log=display.get_console().log)
+                    alerts.check_and_fire(signals, prev_signals)
+                    prev_signals = signals
+                    last_eval = now
+                    dirty = False
+
+            except market_state.SequenceGap as exc:
+                # Drop the subscription; the next pass resyncs over REST and
+                # resubscribes, which re-sends order-book snapshots.
+                display.get_console().log(f"[yellow]Feed gap ({exc}), resyncing[/yellow]")
             except Exception as exc:
-                markets = []
-                display.console.log(f"[red]Error fetching markets: {exc}[/red]")
-
-            # --- 2. Fetch order books (sample to limit API calls) ---
-            tickers = [m["ticker"] for m in markets if m.get("ticker")]
-            sample = random.sample(
-                tickers, min(config.OB_SAMPLE_TOP_N, len(tickers))
-            )
-            orderbooks: Dict[str, Dict] = {}
-            for ticker in sample:
-                try:
-                    orderbooks[ticker] = client.get_orderbook(ticker)
-                except Exception:
-                    pass
+                display.get_console().log(f"[red]Stream error: {exc}[/red]")
+                time.sleep(config.STREAM_RECONNECT_SECS)
 
-            # --- 3. Update rolling data store ---
-            data_store.update(markets)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        display.stop_live()
+        print("\nKalshi Monitor stopped.")
+
+
+def run_poll(client: "KalshiClient", record: Optional[str] = None) -> None:
+    """Fixed-interval polling loop with the live dashboard."""
+    import alerts
+    import display
+
+    prev_signals: Dict = {}
+
+    display.start_live()
+
+    try:
+        while True:
+            try:
+                markets, orderbooks = _poll(client)
+            except Exception as exc:
+                markets, orderbooks = [], {}
+                display.get_console().log(f"[red]Error fetching markets: {exc}[/red]")
+            _record(record, markets, orderbooks)
 
             # --- 4. Run strategies ---
             signals = run_all_strategies(markets, orderbooks)
@@ -84,6 +249,8 @@ def main() -> None:
             display.render(signals, market_count=len(markets))
 
             # --- 6. Alerts ---
+            _publish(signals, len(markets))
+            _journal_signals(signals, orderbooks, log=display.get_console().log)
             alerts.check_and_fire(signals, prev_signals)
             prev_signals = signals
 
@@ -97,5 +264,473 @@ def main() -> None:
         print("\nKalshi Monitor stopped.")
 
 
+def _apply_common(args: argparse.Namespace) -> None:
+    if getattr(args, "strategies", None):
+        config.ENABLED_STRATEGIES = strategies.enabled(
+            s.strip() for s in args.strategies.split(",") if s.strip()
+        )
+    if hasattr(args, "strategies"):
+        # Keep as much history as the deepest enabled strategy reads
+        needs = strategies.requirements()
+        if needs.history:
+            data_store.resize(needs.history)
+
+
+def run_tiered(client: "KalshiClient", record: Optional[str] = None) -> None:
+    """
+    Polling loop driven by scheduler.TieredScheduler: the bulk listing runs
+    every POLL_BULK_SECS, hot/warm markets are refreshed individually in
+    between, and strategies re-run every POLL_HOT_SECS on the merged state.
+    History is sampled from the merged state every POLL_INTERVAL_SECS so
+    every ticker's window spans the same time as in plain polling; it is
+    kept even without mean_reversion, since the scheduler scores movement.
+    """
+    import alerts
+    import display
+    import scheduler
+
+    needs = strategies.requirements().merge(scheduler.INPUTS)
+    data_store.resize(needs.history)
+    sched = scheduler.TieredScheduler()
+    last_history: Optional[float] = None
+    by_ticker: Dict[str, Dict] = {}
+    orderbooks: Dict[str, Dict] = {}
+    prev_signals: Dict = {}
+
+    display.start_live()
+
+    try:
+        while True:
+            now = time.monotonic()
+
+            # --- Bulk listing (cold markets, re-tiering, order book sample) ---
+            if sched.bulk_due(now):
+                try:
+                    markets, orderbooks = _poll(client, history=False)
+                    by_ticker = {m["ticker"]: m for m in markets if m.get("ticker")}
+                    _record(record, markets, orderbooks)
+                except Exception as exc:
+                    display.get_console().log(f"[red]Error fetching markets: {exc}[/red]")
+                sched.reclassify(list(by_ticker.values()))
+                sched.mark_bulk(now, requests=1 + len(orderbooks))
+
+            # --- Hot/warm refreshes within the request budget ---
+            due = sched.due_singles(now)
+            for ticker in due:
+                try:
+                    by_ticker[ticker] = client.get_market(ticker)
+                except Exception:
+                    continue
+            sched.mark_singles(now, due)
+
+            markets = list(by_ticker.values())
+            if needs.history and (
+                last_history is None or now - last_history >= config.POLL_INTERVAL_SECS
+            ):
+                orderbook_store.drop(data_store.update(markets))
+                last_history = now
+
+            signals = run_all_strategies(markets, orderbooks)
+            display.render(signals, market_count=len(markets))
+            _publish(signals, len(markets))
+            _journal_signals(signals, orderbooks, log=display.get_console().log)
+            alerts.check_and_fire(signals, prev_signals)
+            prev_signals = signals
+
+            time.sleep(config.POLL_HOT_SECS)
+
+    except KeyboardInterrupt:
+        pass
+    finally:
+        display.stop_live()
+        print("\nKalshi Monitor stopped.")
+
+
+def _open_journal(path: Optional[str]) -> None:
+    global _journal
+    if path:
+        from journal import Journal
+        _journal = Journal(path)
+
+
+def _close_journal() -> None:
+    global _journal
+    if _journal is not None:
+        _journal.close()
+        _journal = None
+
+
+def cmd_monitor(args: argparse.Namespace) -> int:
+    global _publisher
+    from kalshi_client import KalshiClient
+
+    config.STREAM_ADDRESS = args.stream_address
+    client = KalshiClient(base_url=args.base_url)
+    if args.publish:
+        from fanout import Publisher
+        _publisher = Publisher(args.publish).start()
+    _open_journal(args.journal)
+    try:
+        if args.stream:
+            run_stream(client)
+        elif args.tiered or config.TIERED_POLLING:
+            run_tiered(client, record=args.record)
+        else:
+            run_poll(client, record=args.record)
+    finally:
+        if _publisher is not None:
+            _publisher.close()
+            _publisher = None
+        _close_journal()
+    return 0
+
+
+def cmd_subscribe(args: argparse.Namespace) -> int:
+    """Render and alert from a publisher's feed; makes no API calls."""
+    import fanout
+
+    if args.json:
+        try:
+            while True:
+                try:
+                    for signals, market_count in fanout.subscribe(args.address):
+                        sys.stdout.write(
+                            json.dumps({"market_count": market_count, "signals": signals}) + "\n"
+                        )
+                        sys.stdout.flush()
+                except BrokenPipeError:
+                    return 0
+                except (OSError, ConnectionError) as exc:
+                    print(f"Feed lost ({exc}), reconnecting", file=sys.stderr)
+                    time.sleep(config.STREAM_RECONNECT_SECS)
+        except KeyboardInterrupt:
+            pass
+        return 0
+
+    import alerts
+    import display
+
+    prev_signals: Dict = {}
+    display.start_live()
+    try:
+        while True:
+            try:
+                for signals, market_count in fanout.subscribe(args.address):
+                    display.render(signals, market_count=market_count)
+                    alerts.check_and_fire(signals, prev_signals)
+                    prev_signals = signals
+            except (OSError, ConnectionError) as exc:
+                display.get_console().log(f"[red]Feed lost ({exc}), reconnecting[/red]")
+                time.sleep(config.STREAM_RECONNECT_SECS)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        display.stop_live()
+        print("\nKalshi Monitor stopped.")
+    return 0
+
+
+def cmd_scan(args: argparse.Namespace) -> int:
+    from kalshi_client import KalshiClient
+
+    client = KalshiClient(base_url=args.base_url)
+    try:
+        markets, orderbooks = _poll(client)
+    except Exception as exc:
+        print(f"Error fetching markets: {exc}", file=sys.stderr)
+        return 1
+    _record(args.record, markets, orderbooks)
+
+    signals = run_all_strategies(markets, orderbooks)
+    _open_journal(args.journal)
+    try:
+        _journal_signals(signals, orderbooks)
+    finally:
+        _close_journal()
+    json.dump(
+        {"ts": time.time(), "market_count": len(markets), "signals": signals},
+        sys.stdout,
+        indent=args.indent,
+    )
+    sys.stdout.write("\n")
+    return 0
+
+
+def cmd_replay(args: argparse.Namespace) -> int:
+    needs = strategies.requirements()
+    with open(args.path) as fh:
+        for line in fh:
+            if not line.strip():
+                continue
+            snap = json.loads(line)
+            ts = snap.get("ts")
+            markets = snap.get("markets") or []
+            orderbooks = snap.get("orderbooks") or {}
+            if needs.orderbooks:
+                for ticker, ob in orderbooks.items():
+                    orderbook_store.update(ticker, ob)
+            if needs.history:
+                # Judge close times as of the recording, not today
+                now = datetime.fromtimestamp(ts, timezone.utc) if ts is not None else None
+                orderbook_store.drop(data_store.update(markets, now=now))
+
+            signals = run_all_strategies(markets, orderbooks)
+            counts = {name: len(s) for name, s in signals.items()}
+            out = {"ts": ts, "market_count": len(markets)}
+            out["signals" if args.full else "counts"] = signals if args.full else counts
+            sys.stdout.write(json.dumps(out) + "\n")
+    return 0
+
+
+def cmd_bench(args: argparse.Namespace) -> int:
+    from stream_server import Feed
+
+    feed = Feed(args.markets, seed=args.seed)
+    markets = list(feed.markets.values())
+    book_tickers = feed.tickers[:config.OB_SAMPLE_TOP_N]
+    names = strategies.enabled()
+    needs = strategies.requirements(names)
+    timings = {name: 0.0 for name in ["ingest"] + names}
+
+    for _ in range(args.cycles):
+        for _ in range(args.markets):
+            feed.step()
+
+        t0 = time.perf_counter()
+        orderbooks: Dict[str, Dict] = {}
+        if needs.orderbooks:
+            orderbooks = {t: feed.snapshot(t) for t in book_tickers}
+            for ticker, ob in orderbooks.items():
+                orderbook_store.update(ticker, ob)
+        if needs.history:
+            data_store.update(markets)
+        inputs: Dict = {"orderbooks": orderbooks}
+        if needs.events:
+            inputs["events"] = strategies.group_by_event(markets)
+        timings["ingest"] += time.perf_counter() - t0
+
+        for name in names:
+            fn = strategies.get(name)
+            t0 = time.perf_counter()
+            fn(markets, **inputs)
+            timings[name] += time.perf_counter() - t0
+
+    per_cycle_ms = {k: round(v * 1000 / args.cycles, 3) for k, v in timings.items()}
+    json.dump({
+        "markets": args.markets,
+        "cycles": args.cycles,
+        "per_cycle_ms": per_cycle_ms,
+        "total_per_cycle_ms": round(sum(per_cycle_ms.values()), 3),
+        "data_store": data_store.memory_usage(),
+    }, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+def _rss_bytes() -> int:
+    """Peak resident set size of this process."""
+    import platform
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if platform.system() == "Darwin" else peak * 1024
+
+
+def cmd_soak(args: argparse.Namespace) -> int:
+    """
+    Run ingestion and strategies over a rotating synthetic universe: every
+    --rotate-every cycles one ticker is delisted and a new one listed. Fails
+    if peak RSS keeps growing after warm-up or data_store exceeds its budget.
+    """
+    if args.budget_bytes is not None:
+        config.DATA_STORE_MAX_BYTES = args.budget_bytes
+    needs = strategies.requirements()
+    rng = random.Random(args.seed)
+    close_time = "2999-12-31T00:00:00Z"
+    # Synthetic clock, one poll interval per cycle
+    start = datetime.now(timezone.utc).timestamp()
+    warmup = max(1, args.cycles // 10)
+    checkpoint = max(1, args.cycles // 20)
+    baseline = 0
+    checkpoints: List[int] = []
+
+    started = time.perf_counter()
+    for cycle in range(args.cycles):
+        base = cycle // args.rotate_every
+        markets = []
+        for i in range(args.markets):
+            yes_ask = rng.randint(2, 98)
+            markets.append({
+                "ticker": f"SOAK-{base + i}",
+                "event_ticker": f"SOAKEV-{(base + i) // 5}",
+                "title": f"Soak above {(base + i) % 5 * 25}bps",
+                "yes_bid": yes_ask - 1,
+                "yes_ask": yes_ask,
+                "no_ask": 101 - yes_ask,
+                "volume": cycle,
+                "close_time": close_time,
+            })
+
+        orderbooks: Dict[str, Dict] = {}
+        if needs.orderbooks:
+            ticker = markets[cycle % len(markets)]["ticker"]
+            orderbooks[ticker] = {
+                "yes": [[rng.randint(1, 50), rng.randint(1, 500)]],
+                "no": [[rng.randint(1, 50), rng.randint(1, 500)]],
+            }
+            orderbook_store.update(ticker, orderbooks[ticker])
+        if needs.history:
+            now = datetime.fromtimestamp(start + cycle * config.POLL_INTERVAL_SECS, timezone.utc)
+            orderbook_store.drop(data_store.update(markets, now=now))
+        if cycle % args.eval_every == 0:
+            run_all_strategies(markets, orderbooks)
+
+        if cycle + 1 == warmup:
+            baseline = _rss_bytes()
+        elif cycle + 1 > warmup and (cycle + 1) % checkpoint == 0:
+            checkpoints.append(_rss_bytes())
+
+    final = _rss_bytes()
+    usage = data_store.memory_usage()
+    limit = baseline * (1 + args.tolerance) + 1024 * 1024
+    ok = final <= limit and usage["estimated_bytes"] <= usage["budget_bytes"]
+    json.dump({
+        "ok": ok,
+        "cycles": args.cycles,
+        "elapsed_s": round(time.perf_counter() - started, 1),
+        "peak_rss_bytes": {"baseline": baseline, "final": final, "limit": int(limit),
+                           "checkpoints": checkpoints},
+        "data_store": usage,
+    }, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0 if ok else 1
+
+
+def _epoch(value: Optional[str]) -> Optional[float]:
+    """Accept epoch seconds or an ISO-8601 UTC time."""
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return data_store.parse_time(value).timestamp()
+
+
+def cmd_journal(args: argparse.Namespace) -> int:
+    from journal import Journal
+
+    jr = Journal(args.path)
+    try:
+        rows = jr.history(
+            ticker=args.ticker,
+            strategy=args.strategy,
+            since=_epoch(args.since),
+            until=_epoch(args.until),
+            active=args.active,
+            limit=args.limit,
+        )
+        for row in rows:
+            if args.events:
+                row["events"] = jr.events(row["id"])
+            sys.stdout.write(json.dumps(row) + "\n")
+    finally:
+        jr.close()
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Kalshi prediction monitor")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--strategies", metavar="NAMES",
+                        help="comma-separated strategies to run "
+                             "(default: config.ENABLED_STRATEGIES)")
+
+    p = sub.add_parser("monitor", parents=[common], help="live dashboard (default)")
+    p.add_argument("--stream", action="store_true",
+                   help="ingest pushed deltas from STREAM_ADDRESS instead of polling")
+    p.add_argument("--stream-address", default=config.STREAM_ADDRESS)
+    p.add_argument("--tiered", action="store_true",
+                   help="refresh hot markets individually, cold ones via the bulk listing")
+    p.add_argument("--base-url", default=config.BASE_URL)
+    p.add_argument("--record", metavar="PATH",
+                   help="append each poll snapshot to PATH for replay")
+    p.add_argument("--publish", nargs="?", const=config.FANOUT_ADDRESS, metavar="ADDR",
+                   help="serve signals to subscribers (host:port or unix:/path)")
+    p.add_argument("--journal", nargs="?", const=config.JOURNAL_PATH, metavar="PATH",
+                   help="record signal lifecycles to a SQLite journal")
+    p.set_defaults(func=cmd_monitor)
+
+    p = sub.add_parser("subscribe", help="dashboard fed by a publishing monitor")
+    p.add_argument("address", nargs="?", default=config.FANOUT_ADDRESS)
+    p.add_argument("--json", action="store_true",
+                   help="print the full signal set per frame instead of the dashboard")
+    p.set_defaults(func=cmd_subscribe)
+
+    p = sub.add_parser("scan", parents=[common], help="one-shot scan, print JSON signals")
+    p.add_argument("--base-url", default=config.BASE_URL)
+    p.add_argument("--record", metavar="PATH",
+                   help="append the snapshot to PATH for replay")
+    p.add_argument("--indent", type=int, default=None)
+    p.add_argument("--journal", nargs="?", const=config.JOURNAL_PATH, metavar="PATH",
+                   help="record signal lifecycles to a SQLite journal")
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("journal", help="query the signal journal")
+    p.add_argument("path", nargs="?", default=config.JOURNAL_PATH)
+    p.add_argument("--ticker")
+    p.add_argument("--strategy")
+    p.add_argument("--since", help="epoch seconds or ISO-8601 UTC (open time)")
+    p.add_argument("--until", help="epoch seconds or ISO-8601 UTC (open time)")
+    p.add_argument("--active", action="store_true", help="only signals still open")
+    p.add_argument("--events", action="store_true", help="include open/peak/close events")
+    p.add_argument("--limit", type=int, default=1000)
+    p.set_defaults(func=cmd_journal)
+
+    p = sub.add_parser("replay", parents=[common], help="run strategies over recorded snapshots")
+    p.add_argument("path", help="JSON-lines file written with --record")
+    p.add_argument("--full", action="store_true",
+                   help="print full signals instead of per-strategy counts")
+    p.set_defaults(func=cmd_replay)
+
+    p = sub.add_parser("bench", parents=[common], help="time the pipeline on synthetic markets")
+    p.add_argument("--markets", type=int, default=config.MAX_MARKETS)
+    p.add_argument("--cycles", type=int, default=100)
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_bench)
+
+    p = sub.add_parser("soak", parents=[common],
+                       help="long synthetic run asserting steady-state memory")
+    p.add_argument("--cycles", type=int, default=1_000_000)
+    p.add_argument("--markets", type=int, default=20)
+    p.add_argument("--rotate-every", type=int, default=10,
+                   help="cycles between delisting one ticker and listing another")
+    p.add_argument("--budget-bytes", type=int, default=None,
+                   help="override DATA_STORE_MAX_BYTES")
+    p.add_argument("--eval-every", type=int, default=1,
+                   help="run strategies every N cycles")
+    p.add_argument("--tolerance", type=float, default=0.05,
+                   help="allowed peak-RSS growth after warm-up")
+    p.add_argument("--seed", type=int, default=0)
+    p.set_defaults(func=cmd_soak)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    # Bare `python main.py [--stream ...]` keeps meaning monitor
+    if not argv or (argv[0].startswith("-") and argv[0] not in ("-h", "--help")):
+        argv = ["monitor", *argv]
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    try:
+        _apply_common(args)
+    except ValueError as exc:
+        parser.error(str(exc))
+    return args.func(args)
+
+
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
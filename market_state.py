@@ -0,0 +1,104 @@
+"""
+Live market state maintained from streaming feed messages.
+
+Markets are seeded from a REST snapshot via load(); ticker messages then
+patch quote fields in place and order-book messages are applied to
+orderbook_store. Sequence numbers are tracked per subscription id so a
+missed message surfaces as SequenceGap and the caller can resync.
+"""
+
+from typing import Dict, List, Optional, Set
+import orderbook_store
+
+# ticker message field -> market field
+_TICKER_FIELDS = {
+    "yes_bid": "yes_bid",
+    "yes_ask": "yes_ask",
+    "no_bid": "no_bid",
+    "no_ask": "no_ask",
+    "price": "last_price",
+    "volume": "volume",
+    "open_interest": "open_interest",
+}
+
+# { ticker: market dict (REST shape) }
+_markets: Dict[str, Dict] = {}
+# { sid: last seq seen }
+_seq: Dict[int, int] = {}
+_book_tickers: Set[str] = set()
+
+
+class SequenceGap(Exception):
+    """Raised when a subscription skips a sequence number."""
+
+
+def load(markets: List[Dict]) -> None:
+    """Replace market state with a REST snapshot and reset sequence tracking."""
+    _markets.clear()
+    for m in markets:
+        ticker = m.get("ticker")
+        if ticker:
+            _markets[ticker] = dict(m)
+    _seq.clear()
+    _book_tickers.clear()
+
+
+def markets() -> List[Dict]:
+    return list(_markets.values())
+
+
+def book_tickers() -> List[str]:
+    """Tickers that have received an order-book snapshot on this subscription."""
+    return sorted(_book_tickers)
+
+
+def _check_seq(sid: Optional[int], seq: int) -> None:
+    last = _seq.get(sid)
+    if last is not None and seq != last + 1:
+        raise SequenceGap(f"sid {sid}: expected seq {last + 1}, got {seq}")
+    _seq[sid] = seq
+
+
+def _apply_ticker(market: Dict, msg: Dict) -> bool:
+    changed = False
+    for src, dst in _TICKER_FIELDS.items():
+        value = msg.get(src)
+        if value is not None and market.get(dst) != value:
+            market[dst] = value
+            changed = True
+    # The ticker channel quotes the Yes side only; derive the No side.
+    if "no_ask" not in msg and msg.get("yes_bid") is not None:
+        market["no_ask"] = 100 - msg["yes_bid"]
+    if "no_bid" not in msg and msg.get("yes_ask") is not None:
+        market["no_bid"] = 100 - msg["yes_ask"]
+    return changed
+
+
+def apply(message: Dict) -> bool:
+    """
+    Apply one feed message. Returns True if market or book state changed.
+    Raises SequenceGap if a sequenced subscription skipped a message.
+    """
+    if message.get("seq") is not None:
+        _check_seq(message.get("sid"), message["seq"])
+
+    msg = message.get("msg") or {}
+    ticker = msg.get("market_ticker")
+    mtype = message.get("type")
+
+    if mtype == "ticker":
+        market = _markets.get(ticker)
+        return market is not None and _apply_ticker(market, msg)
+
+    if mtype == "orderbook_snapshot":
+        _book_tickers.add(ticker)
+        orderbook_store.update(ticker, msg)
+        return True
+
+    if mtype == "orderbook_delta":
+        _book_tickers.add(ticker)
+        return orderbook_store.apply_delta(
+            ticker, msg["side"], msg["price"], msg["delta"]
+        )
+
+    return False
@@ -0,0 +1,193 @@
+"""
+In-memory per-ticker order-book store with delta-encoded history.
+
+Each ticker keeps its latest book as {price: qty} maps per side plus a rolling
+deque of the level changes that produced it, so a refetch only records what
+moved. Side totals, best prices and sum(qty * price) are maintained
+incrementally as changes are applied, so readers never re-sum the levels.
+Together they give each side's mean distance from its best price, from
+which the touch-weighted imbalance is derived in O(1).
+"""
+
+from collections import OrderedDict, deque
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Tuple
+import config
+
+SIDES = ("yes", "no")
+
+
+class _Book:
+    __slots__ = ("levels", "totals", "notional", "best", "history")
+
+    def __init__(self) -> None:
+        self.levels: Dict[str, Dict[int, int]] = {"yes": {}, "no": {}}
+        self.totals = {"yes": 0, "no": 0}
+        # sum(qty * price); with totals and best this gives sum(qty * (best - price))
+        self.notional = {"yes": 0, "no": 0}
+        self.best: Dict[str, Optional[int]] = {"yes": None, "no": None}
+        # deque([(timestamp, ((side, price, qty), ...), yes_total, no_total), ...])
+        self.history: deque = deque(maxlen=config.OB_HISTORY_WINDOW)
+
+
+# { ticker: _Book }, least recently updated first
+_store: "OrderedDict[str, _Book]" = OrderedDict()
+
+
+def _touch(ticker: str) -> _Book:
+    """Return the book for a ticker, creating it and evicting LRU tickers."""
+    book = _store.get(ticker)
+    if book is None:
+        book = _store[ticker] = _Book()
+        while len(_store) > config.OB_STORE_MAX_TICKERS:
+            _store.popitem(last=False)
+    else:
+        _store.move_to_end(ticker)
+    return book
+
+
+def _set_level(book: _Book, side: str, price: int, qty: int) -> bool:
+    """Set one level to an absolute quantity. Returns True if it changed."""
+    levels = book.levels[side]
+    old = levels.get(price, 0)
+    qty = max(qty, 0)
+    if qty == old:
+        return False
+
+    if qty:
+        levels[price] = qty
+    else:
+        del levels[price]
+
+    change = qty - old
+    book.totals[side] += change
+    book.notional[side] += change * price
+
+    best = book.best[side]
+    if qty and (best is None or price > best):
+        book.best[side] = price
+    elif not qty and price == best:
+        book.best[side] = max(levels) if levels else None
+    return True
+
+
+def _record(book: _Book, changes: List[Tuple[str, int, int]]) -> None:
+    if changes:
+        book.history.append((
+            datetime.utcnow(),
+            tuple(changes),
+            book.totals["yes"],
+            book.totals["no"],
+        ))
+
+
+def update(ticker: str, orderbook: Dict) -> Dict:
+    """
+    Ingest a full book snapshot for a ticker.
+    Only levels that differ from the stored book are applied and recorded.
+    Returns the ticker's metrics after the update.
+    """
+    book = _touch(ticker)
+    changes: List[Tuple[str, int, int]] = []
+    for side in SIDES:
+        incoming: Dict[int, int] = {}
+        for level in orderbook.get(side) or []:
+            if len(level) >= 2:
+                incoming[int(level[0])] = int(level[1])
+        for price in book.levels[side]:
+            incoming.setdefault(price, 0)  # level disappeared
+        for price, qty in incoming.items():
+            if _set_level(book, side, price, qty):
+                changes.append((side, price, max(qty, 0)))
+    _record(book, changes)
+    return metrics(ticker)
+
+
+def apply_delta(ticker: str, side: str, price: int, delta: int) -> bool:
+    """
+    Apply a relative quantity change at one price level (streaming deltas).
+    Returns True if the book changed.
+    """
+    book = _touch(ticker)
+    price = int(price)
+    qty = book.levels[side].get(price, 0) + int(delta)
+    if not _set_level(book, side, price, qty):
+        return False
+    _record(book, [(side, price, max(qty, 0))])
+    return True
+
+
+def _near_touch_depth(book: _Book, side: str) -> float:
+    """
+    Side depth discounted by its mean distance (in cents) from the best price:
+    total / (1 + mean(best - price)). Depth resting at the touch counts in
+    full, depth spread deeper into the book counts less.
+    """
+    total = book.totals[side]
+    best = book.best[side]
+    if not total or best is None:
+        return 0.0
+    mean_distance = (best * total - book.notional[side]) / total
+    return total / (1 + mean_distance)
+
+
+def metrics(ticker: str) -> Optional[Dict]:
+    """
+    Return precomputed book metrics for a ticker, or None if unseen.
+    yes levels are bids for Yes, no levels are bids for No (asks for Yes).
+    """
+    book = _store.get(ticker)
+    if book is None:
+        return None
+
+    bid_qty = book.totals["yes"]
+    ask_qty = book.totals["no"]
+    total = bid_qty + ask_qty
+    bid_near = _near_touch_depth(book, "yes")
+    ask_near = _near_touch_depth(book, "no")
+    near_total = bid_near + ask_near
+
+    bid_change = ask_change = 0
+    if book.history:
+        _, _, old_bid, old_ask = book.history[0]
+        bid_change = bid_qty - old_bid
+        ask_change = ask_qty - old_ask
+
+    return {
+        "bid_qty": bid_qty,
+        "ask_qty": ask_qty,
+        "imbalance": bid_qty / total if total else None,
+        "weighted_imbalance": bid_near / near_total if near_total else None,
+        "best_bid": book.best["yes"],
+        "best_ask": book.best["no"],
+        "bid_qty_change": bid_change,
+        "ask_qty_change": ask_change,
+        "updates": len(book.history),
+    }
+
+
+def get_book(ticker: str) -> Dict[str, List[List[int]]]:
+    """Return the latest book in API shape ({side: [[price, qty], ...]}, ascending)."""
+    book = _store.get(ticker)
+    if book is None:
+        return {"yes": [], "no": []}
+    return {
+        side: [[p, q] for p, q in sorted(book.levels[side].items())]
+        for side in SIDES
+    }
+
+
+def get_history(ticker: str) -> List[Tuple[datetime, tuple, int, int]]:
+    """Return the delta-encoded update history for a ticker (oldest first)."""
+    book = _store.get(ticker)
+    return list(book.history) if book else []
+
+
+def drop(tickers: Iterable[str]) -> None:
+    """Forget the given tickers."""
+    for ticker in tickers:
+        _store.pop(ticker, None)
+
+
+def clear() -> None:
+    _store.clear()
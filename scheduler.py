@@ -0,0 +1,154 @@
+"""
+Tiered poll scheduler — spend refreshes where signals are likely to change.
+
+Each market is scored on recent price movement, proximity to the spread-arb,
+wide-spread and theta cutoffs, and volume:
+  hot   score >= 2  refreshed via get_market every POLL_HOT_SECS
+  warm  score == 1  refreshed via get_market every POLL_WARM_SECS
+  cold  score == 0  refreshed only by the bulk listing every POLL_BULK_SECS
+
+Single-market refreshes draw from a token bucket filled at POLL_REQUEST_BUDGET
+requests/sec, and the bulk listing plus its order-book sample are charged to
+the same bucket. By default the budget is what plain polling would spend for
+the enabled strategies (one listing, plus OB_SAMPLE_TOP_N books if any
+strategy reads order books, per POLL_INTERVAL_SECS), so total request volume
+stays at plain-polling levels.
+"""
+
+from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+import config
+import data_store
+import strategies
+
+HOT, WARM, COLD = "hot", "warm", "cold"
+
+# score() reads price movement over the data_store window, so tiered mode
+# keeps history even when no enabled strategy does
+INPUTS = strategies.Inputs(history=config.DATA_STORE_WINDOW)
+
+
+@lru_cache(maxsize=4096)
+def _close_dt(close_str: str) -> Optional[datetime]:
+    try:
+        return data_store.parse_time(close_str)
+    except ValueError:
+        return None
+
+
+def score(market: Dict, now: Optional[datetime] = None) -> int:
+    """Count how many "likely to signal soon" conditions a market meets."""
+    points = 0
+    near = config.SCHED_NEAR_CENTS
+    yes_ask = market.get("yes_ask")
+    yes_bid = market.get("yes_bid")
+    no_ask = market.get("no_ask")
+
+    # Spread arb: yes_ask + no_ask at or near the threshold
+    if yes_ask is not None and no_ask is not None:
+        if yes_ask + no_ask <= config.SPREAD_ARB_THRESHOLD + near:
+            points += 2
+
+    # Market making: spread at or near the wide-spread cutoff
+    if yes_ask is not None and yes_bid is not None:
+        if yes_ask - yes_bid >= config.WIDE_SPREAD_MIN_CENTS - near:
+            points += 1
+
+    # Theta: closing soon and priced at or near the cutoff
+    close_str = market.get("close_time") or market.get("expiration_time")
+    if yes_ask is not None and close_str and yes_ask >= config.THETA_MIN_YES_PRICE - near:
+        close_dt = _close_dt(close_str)
+        if close_dt is not None:
+            now = now or datetime.now(timezone.utc)
+            days_left = (close_dt - now).total_seconds() / 86400
+            if 0 < days_left <= config.THETA_DAYS_TO_CLOSE:
+                points += 2
+
+    # Recent movement over the history window
+    ticker = market.get("ticker")
+    first, last = data_store.oldest(ticker), data_store.latest(ticker)
+    if first and last and abs(last[1] - first[1]) >= config.SCHED_MOVE_CENTS:
+        points += 1
+
+    volume = market.get("volume") or market.get("volume_24h") or 0
+    if volume >= config.SCHED_ACTIVE_VOLUME:
+        points += 1
+
+    return points
+
+
+def classify(market: Dict, now: Optional[datetime] = None) -> str:
+    points = score(market, now)
+    if points >= 2:
+        return HOT
+    return WARM if points == 1 else COLD
+
+
+def plain_poll_rate() -> float:
+    """Requests/sec plain polling makes for the enabled strategies."""
+    books = config.OB_SAMPLE_TOP_N if strategies.requirements().orderbooks else 0
+    return (1 + books) / config.POLL_INTERVAL_SECS
+
+
+class TieredScheduler:
+    def __init__(self, budget: Optional[float] = None) -> None:
+        if budget is None:
+            budget = config.POLL_REQUEST_BUDGET
+        self.budget = plain_poll_rate() if budget is None else budget
+        self.tokens = 0.0
+        self.tiers: Dict[str, str] = {}
+        self.last_refresh: Dict[str, float] = {}
+        self.last_bulk: Optional[float] = None
+        self._last_refill: Optional[float] = None
+
+    def _refill(self, now: float) -> None:
+        if self._last_refill is not None:
+            # Cap the bucket at one bulk interval so idle time can't bank a burst
+            cap = self.budget * config.POLL_BULK_SECS
+            self.tokens = min(cap, self.tokens + (now - self._last_refill) * self.budget)
+        self._last_refill = now
+
+    def reclassify(self, markets: List[Dict]) -> Dict[str, int]:
+        """Re-tier all markets. Returns tier counts."""
+        now = datetime.now(timezone.utc)
+        self.tiers = {
+            m["ticker"]: classify(m, now) for m in markets if m.get("ticker")
+        }
+        live = self.tiers.keys()
+        self.last_refresh = {t: ts for t, ts in self.last_refresh.items() if t in live}
+        counts = {HOT: 0, WARM: 0, COLD: 0}
+        for tier in self.tiers.values():
+            counts[tier] += 1
+        return counts
+
+    def bulk_due(self, now: float) -> bool:
+        return self.last_bulk is None or now - self.last_bulk >= config.POLL_BULK_SECS
+
+    def mark_bulk(self, now: float, requests: int) -> None:
+        """Record a bulk listing; it resets every market's refresh clock."""
+        self._refill(now)
+        self.tokens -= requests
+        self.last_bulk = now
+        for ticker in self.tiers:
+            self.last_refresh[ticker] = now
+
+    def due_singles(self, now: float) -> List[str]:
+        """Hot then warm tickers whose interval elapsed, stalest first, within budget."""
+        self._refill(now)
+        intervals = {HOT: config.POLL_HOT_SECS, WARM: config.POLL_WARM_SECS}
+        due: List[Tuple[int, float, str]] = []
+        for ticker, tier in self.tiers.items():
+            interval = intervals.get(tier)
+            if interval is None:
+                continue
+            last = self.last_refresh.get(ticker, 0.0)
+            if now - last >= interval:
+                due.append((0 if tier == HOT else 1, last, ticker))
+        due.sort()
+        return [ticker for _, _, ticker in due[:max(0, int(self.tokens))]]
+
+    def mark_singles(self, now: float, tickers: List[str]) -> None:
+        self.tokens -= len(tickers)
+        for ticker in tickers:
+            self.last_refresh[ticker] = now
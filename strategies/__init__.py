@@ -1,9 +1,18 @@
-from .spread_arb import run as spread_arb
-from .correlated_arb import run as correlated_arb
-from .order_book import run as order_book
-from .market_maker import run as market_maker
-from .mean_reversion import run as mean_reversion
-from .theta import run as theta
+"""
+Strategy registry. `strategies.get(name)` returns a strategy's
+`run(markets, **inputs)` function.
+
+Strategy modules are imported on first use so commands that run a subset
+(or none) of them don't pay for the rest. Each module declares
+the data it reads as a module-level `INPUTS`; the engine merges the
+declarations of the enabled strategies and only builds those inputs.
+"""
+
+import importlib
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+import config
 
 __all__ = [
     "spread_arb",
@@ -13,3 +22,66 @@ __all__ = [
     "mean_reversion",
     "theta",
 ]
+
+
+@dataclass(frozen=True)
+class Inputs:
+    """Data a strategy reads beyond the market list itself."""
+    orderbooks: bool = False              # per-ticker books (orderbook_store)
+    history: int = 0                      # polls of data_store history needed (its window)
+    events: bool = False                  # markets grouped by event_ticker
+
+    def merge(self, other: "Inputs") -> "Inputs":
+        return Inputs(
+            orderbooks=self.orderbooks or other.orderbooks,
+            history=max(self.history, other.history),
+            events=self.events or other.events,
+        )
+
+
+_modules: Dict[str, Any] = {}
+
+
+def _module(name: str) -> Any:
+    module = _modules.get(name)
+    if module is not None:
+        return module
+    if name not in __all__:
+        raise ValueError(f"unknown strategy {name!r}; choose from {', '.join(__all__)}")
+    module = _modules[name] = importlib.import_module(f".{name}", __name__)
+    return module
+
+
+def get(name: str) -> Any:
+    """Return a strategy's run function by name."""
+    return _module(name).run
+
+
+def enabled(names: Optional[Iterable[str]] = None) -> List[str]:
+    """Validate strategy names, defaulting to config.ENABLED_STRATEGIES."""
+    names = list(config.ENABLED_STRATEGIES if names is None else names)
+    for name in names:
+        _module(name)
+    return names
+
+
+def requirements(names: Optional[Iterable[str]] = None) -> Inputs:
+    """Merge the declared inputs of the given (or enabled) strategies."""
+    needs = Inputs()
+    for name in enabled(names):
+        needs = needs.merge(_module(name).INPUTS)
+    return needs
+
+
+def group_by_event(markets: List[Dict]) -> Dict[str, List[Dict]]:
+    """Group markets by event_ticker (falling back to ticker)."""
+    groups: Dict[str, List[Dict]] = defaultdict(list)
+    for m in markets:
+        event_ticker = m.get("event_ticker") or m.get("ticker", "")
+        groups[event_ticker].append(m)
+    return groups
+
+
+def signal_key(signal: Dict) -> str:
+    """Identify a signal within its strategy (ticker, or event for event-level signals)."""
+    return signal.get("ticker") or signal.get("event_ticker") or ""
@@ -1,79 +1,121 @@
 """
 Strategy 2 — Correlated Markets Arbitrage
 
-Within an event, sort by yes_ask. A harder condition (e.g. price > 50bps)
-should always have a lower or equal yes_ask than an easier condition
-(price > 25bps). Any inversion is a potential mispricing.
+Within an event, order markets by the numeric threshold in their title. A
+harder condition (e.g. price > 50bps) should always have a lower or equal
+yes_ask than an easier condition (price > 25bps). Any pair violating this —
+adjacent or not — is an inversion and a potential mispricing.
+
+Per event, all inversions are counted in O(n log n) with a Fenwick tree over
+price ranks, and the maximum-mispricing pair is found with a running minimum.
+The top CORRELATED_ARB_TOP_K events across all groups are reported.
 """
 
-from typing import Any, Dict, List
-from collections import defaultdict
+import heapq
+import re
+from typing import Any, Dict, List, Optional, Tuple
+import config
+from . import Inputs, group_by_event
+
+INPUTS = Inputs(events=True)
+
+_NUMBER = re.compile(r"[-+]?\d+\.?\d*")
+
+
+def _threshold(m: Dict) -> float:
+    """Extract the numeric threshold from a market's title (last number)."""
+    title = m.get("title", "") or m.get("ticker", "")
+    nums = _NUMBER.findall(title)
+    return float(nums[-1]) if nums else 0.0
 
 
-def run(markets: List[Dict], **_kwargs: Any) -> List[Dict]:
+def scan_ladder(ladder: List[Tuple[float, Any, Dict]]) -> Tuple[int, Optional[Tuple[Dict, Dict, Any]]]:
     """
-    Groups markets by event_ticker and flags pricing inversions where
-    a market with a higher yes_ask is paired with a market whose title
-    implies a stricter/harder condition but trades at a lower price.
+    ladder: [(threshold, yes_ask, market), ...] sorted by threshold.
+    Returns (inversion_count, (easier, harder, mispricing) or None), where an
+    inversion is any pair with a lower threshold and a strictly lower price.
+    Equal thresholds are never paired.
+    """
+    ranks = {p: i + 1 for i, p in enumerate(sorted({p for _, p, _ in ladder}))}
+    tree = [0] * (len(ranks) + 1)
+
+    count = 0
+    best: Optional[Tuple[Dict, Dict, Any]] = None
+    cheapest: Optional[Tuple[Any, Dict]] = None  # min price among lower thresholds
+
+    start = 0
+    while start < len(ladder):
+        end = start
+        while end < len(ladder) and ladder[end][0] == ladder[start][0]:
+            end += 1
+        group = ladder[start:end]
+
+        # Query the whole threshold group before inserting it
+        for _, price, market in group:
+            i = ranks[price] - 1
+            while i > 0:
+                count += tree[i]
+                i -= i & -i
+            if cheapest is not None and price > cheapest[0]:
+                gap = price - cheapest[0]
+                if best is None or gap > best[2]:
+                    best = (cheapest[1], market, gap)
 
-    Heuristic: within an event group, sort by yes_ask ascending and flag
-    any pair where the implied numeric threshold in the title is inverted
-    relative to the price ordering.
+        for _, price, market in group:
+            i = ranks[price]
+            while i < len(tree):
+                tree[i] += 1
+                i += i & -i
+            if cheapest is None or price < cheapest[0]:
+                cheapest = (price, market)
+
+        start = end
+
+    return count, best
+
+
+def run(
+    markets: List[Dict],
+    events: Optional[Dict[str, List[Dict]]] = None,
+    **_kwargs: Any,
+) -> List[Dict]:
     """
-    # Group by event_ticker
-    groups: Dict[str, List[Dict]] = defaultdict(list)
-    for m in markets:
-        event_ticker = m.get("event_ticker") or m.get("ticker", "")
-        groups[event_ticker].append(m)
+    Groups markets by event_ticker and flags, per event, the pair with the
+    largest inversion: the easier market (lower threshold) trading below a
+    harder one. Each signal carries the event's total inversion count.
+    """
+    # Group by event_ticker (shared by the engine when provided)
+    groups = events if events is not None else group_by_event(markets)
 
     signals = []
     for event_ticker, group in groups.items():
         if len(group) < 2:
             continue
 
-        # Filter to markets with valid yes_ask
-        valid = [m for m in group if m.get("yes_ask") is not None]
-        if len(valid) < 2:
+        # Filter to markets with valid yes_ask, ordered by threshold
+        ladder = [(_threshold(m), m["yes_ask"], m) for m in group if m.get("yes_ask") is not None]
+        if len(ladder) < 2:
+            continue
+        ladder.sort(key=lambda x: x[0])
+
+        inversions, best = scan_ladder(ladder)
+        if best is None:
             continue
 
-        # Extract numeric threshold from title for ordering
-        import re
-        def extract_number(m: Dict) -> float:
-            title = m.get("title", "") or m.get("ticker", "")
-            nums = re.findall(r"[-+]?\d+\.?\d*", title)
-            return float(nums[-1]) if nums else 0.0
-
-        valid.sort(key=extract_number)
-
-        # Now check: as threshold increases, yes_ask should decrease
-        # (harder threshold → lower probability → lower yes_ask)
-        for i in range(len(valid) - 1):
-            low_thresh = valid[i]
-            high_thresh = valid[i + 1]
-
-            thresh_low = extract_number(low_thresh)
-            thresh_high = extract_number(high_thresh)
-
-            if thresh_low == thresh_high:
-                continue
-
-            price_low = low_thresh["yes_ask"]
-            price_high = high_thresh["yes_ask"]
-
-            # Harder condition (high_thresh) should have lower yes_ask
-            # Inversion: high_thresh.yes_ask > low_thresh.yes_ask
-            if price_high > price_low:
-                mispricing = price_high - price_low
-                signals.append({
-                    "event_ticker": event_ticker,
-                    "easier_ticker": low_thresh.get("ticker", ""),
-                    "easier_title": low_thresh.get("title", ""),
-                    "easier_yes_ask": price_low,
-                    "harder_ticker": high_thresh.get("ticker", ""),
-                    "harder_title": high_thresh.get("title", ""),
-                    "harder_yes_ask": price_high,
-                    "mispricing_cents": mispricing,
-                })
-
-    signals.sort(key=lambda x: x["mispricing_cents"], reverse=True)
-    return signals
+        easier, harder, mispricing = best
+        signals.append({
+            "event_ticker": event_ticker,
+            "easier_ticker": easier.get("ticker", ""),
+            "easier_title": easier.get("title", ""),
+            "easier_yes_ask": easier["yes_ask"],
+            "harder_ticker": harder.get("ticker", ""),
+            "harder_title": harder.get("title", ""),
+            "harder_yes_ask": harder["yes_ask"],
+            "mispricing_cents": mispricing,
+            "inversions": inversions,
+            "ladder_size": len(ladder),
+        })
+
+    return heapq.nlargest(
+        config.CORRELATED_ARB_TOP_K, signals, key=lambda x: x["mispricing_cents"]
+    )
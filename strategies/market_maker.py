@@ -7,6 +7,9 @@ Suggested orders: post bid at yes_bid + 1, ask at yes_ask - 1
 
 from typing import Any, Dict, List
 import config
+from . import Inputs
+
+INPUTS = Inputs()
 
 
 def run(markets: List[Dict], **_kwargs: Any) -> List[Dict]:
@@ -9,6 +9,9 @@ Suggests fading the move (betting it reverses).
 from typing import Any, Dict, List
 import data_store
 import config
+from . import Inputs
+
+INPUTS = Inputs(history=config.DATA_STORE_WINDOW)
 
 
 def run(markets: List[Dict], **_kwargs: Any) -> List[Dict]:
@@ -4,57 +4,60 @@ Strategy 3 — Order Book Imbalance
 imbalance = sum(bid_qty) / (sum(bid_qty) + sum(ask_qty))
 Signal: imbalance > OB_IMBALANCE_THRESHOLD (buy pressure)
      or imbalance < 1 - OB_IMBALANCE_THRESHOLD (sell pressure)
+
+Side totals are read from orderbook_store, which maintains them
+incrementally as book updates arrive.
 """
 
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Optional
 import config
+import orderbook_store
+from . import Inputs
 
-
-def _side_totals(levels: List[List]) -> tuple:
-    """Return (total_qty, best_price) from a list of [price, qty] pairs."""
-    total = sum(int(level[1]) for level in levels if len(level) >= 2)
-    best = levels[0][0] if levels else None
-    return total, best
+INPUTS = Inputs(orderbooks=True)
 
 
-def run(markets: List[Dict], orderbooks: Dict[str, Dict], **_kwargs: Any) -> List[Dict]:
+def run(
+    markets: List[Dict], orderbooks: Dict[str, Optional[Dict]], **_kwargs: Any
+) -> List[Dict]:
     """
     Returns top imbalanced markets, sorted by distance from 0.5.
     orderbooks: { ticker: {"yes": [[price,qty],...], "no": [[price,qty],...]} }
+    Each book is applied to orderbook_store (a no-op when it already holds
+    that book) and metrics are read from the result. A None book means the
+    store already has it live (streaming mode).
     """
     signals = []
+    titles = {m.get("ticker"): m.get("title") for m in markets}
+    threshold = config.OB_IMBALANCE_THRESHOLD
 
     for ticker, ob in orderbooks.items():
-        yes_levels = ob.get("yes") or []
-        no_levels = ob.get("no") or []
+        if ob is None:
+            stats = orderbook_store.metrics(ticker)
+            if stats is None:
+                continue
+        else:
+            stats = orderbook_store.update(ticker, ob)
 
-        # yes bids (buyers) and no bids (sellers of yes)
-        bid_qty, best_bid = _side_totals(yes_levels)
-        ask_qty, best_ask = _side_totals(no_levels)
-
-        total = bid_qty + ask_qty
-        if total == 0:
+        imbalance = stats["imbalance"]
+        if imbalance is None:
             continue
 
-        imbalance = bid_qty / total
-
-        threshold = config.OB_IMBALANCE_THRESHOLD
         if imbalance >= threshold or imbalance <= (1 - threshold):
             direction = "BUY" if imbalance >= threshold else "SELL"
-            # Find market title
-            market_info = next(
-                (m for m in markets if m.get("ticker") == ticker),
-                {}
-            )
+            weighted = stats["weighted_imbalance"]
             signals.append({
                 "ticker": ticker,
-                "title": market_info.get("title", ticker),
+                "title": titles.get(ticker) or ticker,
                 "imbalance": round(imbalance, 3),
-                "bid_qty": bid_qty,
-                "ask_qty": ask_qty,
+                "weighted_imbalance": round(weighted, 3) if weighted is not None else None,
+                "bid_qty": stats["bid_qty"],
+                "ask_qty": stats["ask_qty"],
+                "bid_qty_change": stats["bid_qty_change"],
+                "ask_qty_change": stats["ask_qty_change"],
                 "direction": direction,
-                "best_bid": best_bid,
-                "best_ask": best_ask,
+                "best_bid": stats["best_bid"],
+                "best_ask": stats["best_ask"],
             })
 
     # Sort by distance from neutral (0.5), most extreme first
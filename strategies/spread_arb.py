@@ -7,6 +7,9 @@ Net profit estimate: 100 - yes_ask - no_ask minus ~7% fee on winning leg.
 
 from typing import Any, Dict, List
 import config
+from . import Inputs
+
+INPUTS = Inputs()
 
 FEE_RATE = 0.07  # approximate fee on winning leg
 
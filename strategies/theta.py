@@ -8,25 +8,10 @@ Opportunity: sell No contracts (cheap, near-guaranteed win if yes_ask is very hi
 from datetime import datetime, timezone
 from typing import Any, Dict, List
 import config
+import data_store
+from . import Inputs
 
-
-def _parse_dt(dt_str: str) -> datetime:
-    """Parse ISO-8601 datetime string to a timezone-aware datetime."""
-    if not dt_str:
-        raise ValueError("empty datetime string")
-    # Handle various formats from the API
-    for fmt in (
-        "%Y-%m-%dT%H:%M:%SZ",
-        "%Y-%m-%dT%H:%M:%S.%fZ",
-        "%Y-%m-%dT%H:%M:%S+00:00",
-        "%Y-%m-%dT%H:%M:%S",
-    ):
-        try:
-            dt = datetime.strptime(dt_str, fmt)
-            return dt.replace(tzinfo=timezone.utc)
-        except ValueError:
-            continue
-    raise ValueError(f"Cannot parse datetime: {dt_str!r}")
+INPUTS = Inputs()
 
 
 def run(markets: List[Dict], **_kwargs: Any) -> List[Dict]:
@@ -43,7 +28,7 @@ def run(markets: List[Dict], **_kwargs: Any) -> List[Dict]:
             continue
 
         try:
-            close_dt = _parse_dt(close_time_str)
+            close_dt = data_store.parse_time(close_time_str)
         except ValueError:
             continue
 
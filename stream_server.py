@@ -0,0 +1,353 @@
+"""
+Local stand-in for the Kalshi market-data feed, for testing streaming mode.
+
+Serves one synthetic market universe on two ports:
+  - a newline-delimited JSON feed using the Kalshi websocket message shapes
+    (subscribe -> subscribed, ticker, orderbook_snapshot, orderbook_delta)
+  - a minimal REST surface (/markets, /markets/{ticker},
+    /markets/{ticker}/orderbook) used for the initial snapshot and resyncs
+
+Usage:
+  python stream_server.py [--port 8765] [--rest-port 8766] [--markets 200]
+                          [--rate 50] [--gap-prob 0.0]
+
+Then: python main.py --stream --base-url http://127.0.0.1:8766
+"""
+
+import argparse
+import json
+import random
+import socket
+import socketserver
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from queue import Empty, Full, Queue
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlparse
+
+STRIKES_PER_EVENT = 5
+
+
+def make_markets(n: int, seed: int = 0) -> List[Dict]:
+    """Build n synthetic markets in REST shape, grouped into strike ladders."""
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    markets = []
+    for i in range(n):
+        event = f"SYN{i // STRIKES_PER_EVENT:04d}"
+        strike = 25 * (i % STRIKES_PER_EVENT + 1)
+        yes_ask = rng.randint(3, 98)
+        yes_bid = max(1, yes_ask - rng.randint(1, 15))
+        close = now + timedelta(hours=rng.randint(1, 24 * 30))
+        markets.append({
+            "ticker": f"{event}-T{strike}",
+            "event_ticker": event,
+            "title": f"{event} above {strike}bps",
+            "yes_bid": yes_bid,
+            "yes_ask": yes_ask,
+            "no_bid": 100 - yes_ask,
+            "no_ask": 100 - yes_bid - rng.choice((0, 0, 0, 2, 10)),
+            "last_price": yes_bid,
+            "volume": rng.randint(0, 5000),
+            "close_time": close.strftime("%Y-%m-%dT%H:%M:%SZ"),
+        })
+    return markets
+
+
+def make_book(market: Dict, rng: random.Random) -> Dict[str, Dict[int, int]]:
+    """Build a five-level book around a market's quotes."""
+    yes_top = market["yes_bid"]
+    no_top = market["no_bid"]
+    return {
+        "yes": {p: rng.randint(1, 500) for p in range(max(1, yes_top - 4), yes_top + 1)},
+        "no": {p: rng.randint(1, 500) for p in range(max(1, no_top - 4), no_top + 1)},
+    }
+
+
+def _levels(side: Dict[int, int]) -> List[List[int]]:
+    return [[p, q] for p, q in sorted(side.items())]
+
+
+class Feed:
+    """Synthetic market universe that random-walks and broadcasts changes."""
+
+    def __init__(self, n: int, seed: int = 0) -> None:
+        self.rng = random.Random(seed)
+        self.lock = threading.Lock()
+        self.markets = {m["ticker"]: m for m in make_markets(n, seed)}
+        self.books = {t: make_book(m, self.rng) for t, m in self.markets.items()}
+        self.tickers = list(self.markets)
+        # Queues receive (n, message); n numbers every change so a snapshot
+        # can tell which queued messages it already reflects
+        self.n = 0
+        self.subscribers: Set[Queue] = set()
+
+    def subscribe(self) -> Queue:
+        q: Queue = Queue(maxsize=10000)
+        with self.lock:
+            self.subscribers.add(q)
+        return q
+
+    def unsubscribe(self, q: Queue) -> None:
+        with self.lock:
+            self.subscribers.discard(q)
+
+    def subscribed(self, q: Queue) -> bool:
+        """False once q has been dropped for falling behind."""
+        with self.lock:
+            return q in self.subscribers
+
+    def snapshot(self, ticker: str) -> Optional[Dict]:
+        with self.lock:
+            book = self.books.get(ticker)
+            if book is None:
+                return None
+            return {side: _levels(levels) for side, levels in book.items()}
+
+    def snapshots(self, tickers: List[str]) -> Tuple[int, Dict[str, Dict]]:
+        """Books for tickers, taken together, and the last change number they include."""
+        with self.lock:
+            books = {
+                t: {side: _levels(levels) for side, levels in self.books[t].items()}
+                for t in tickers if t in self.books
+            }
+            return self.n, books
+
+    def step(self) -> Dict:
+        """Mutate one market or book level and return the resulting message."""
+        with self.lock:
+            ticker = self.rng.choice(self.tickers)
+            if self.rng.random() < 0.5:
+                m = self.markets[ticker]
+                move = self.rng.choice((-2, -1, 1, 2))
+                m["yes_ask"] = min(99, max(2, m["yes_ask"] + move))
+                m["yes_bid"] = min(m["yes_ask"] - 1, max(1, m["yes_bid"] + move))
+                m["no_bid"] = 100 - m["yes_ask"]
+                m["no_ask"] = 100 - m["yes_bid"]
+                m["last_price"] = m["yes_bid"]
+                m["volume"] += self.rng.randint(0, 20)
+                message = {"type": "ticker", "msg": {
+                    "market_ticker": ticker,
+                    "yes_bid": m["yes_bid"],
+                    "yes_ask": m["yes_ask"],
+                    "price": m["last_price"],
+                    "volume": m["volume"],
+                }}
+            else:
+                side = self.rng.choice(("yes", "no"))
+                levels = self.books[ticker][side]
+                price = self.rng.choice(list(levels) or [50])
+                delta = self.rng.randint(-levels.get(price, 0), 200)
+                qty = levels.get(price, 0) + delta
+                if qty > 0:
+                    levels[price] = qty
+                else:
+                    levels.pop(price, None)
+                message = {"type": "orderbook_delta", "msg": {
+                    "market_ticker": ticker,
+                    "side": side,
+                    "price": price,
+                    "delta": delta,
+                }}
+            self.n += 1
+            n = self.n
+
+            # Put under the lock so queues see changes in n order. A full
+            # queue is dropped rather than silently skipping a message; its
+            # connection is closed and the client resyncs.
+            for q in list(self.subscribers):
+                try:
+                    q.put_nowait((n, message))
+                except Full:
+                    self.subscribers.discard(q)
+        return message
+
+    def run(self, rate: float, stop: threading.Event) -> None:
+        interval = 1.0 / rate
+        while not stop.is_set():
+            self.step()
+            time.sleep(interval)
+
+
+class _Subscription:
+    def __init__(self, sid: int, channel: str, tickers: List[str]) -> None:
+        self.sid = sid
+        self.channel = channel
+        self.tickers = set(tickers)
+        self.seq = 0
+        self.since = 0  # feed changes up to this number are in the snapshot
+
+
+class StreamHandler(socketserver.StreamRequestHandler):
+    """One feed connection: reads subscribe commands, writes matching messages."""
+
+    server: "StreamServer"
+
+    def setup(self) -> None:
+        super().setup()
+        self.write_lock = threading.Lock()
+        self.subs: List[_Subscription] = []
+        self.subs_lock = threading.Lock()
+        self.closed = threading.Event()
+
+    def _send(self, message: Dict) -> None:
+        with self.write_lock:
+            self.wfile.write(json.dumps(message).encode() + b"\n")
+            self.wfile.flush()
+
+    def _send_sequenced(self, sub: _Subscription, message: Dict) -> None:
+        sub.seq += 1
+        if self.server.gap_prob and random.random() < self.server.gap_prob:
+            return  # simulate a dropped message
+        self._send(dict(message, sid=sub.sid, seq=sub.seq))
+
+    def _read_commands(self) -> None:
+        next_sid = 1
+        try:
+            for line in self.rfile:
+                cmd = json.loads(line)
+                if cmd.get("cmd") != "subscribe":
+                    continue
+                params = cmd.get("params") or {}
+                tickers = params.get("market_tickers") or []
+                for channel in params.get("channels") or []:
+                    sub = _Subscription(next_sid, channel, tickers)
+                    next_sid += 1
+                    self._send({"type": "subscribed", "id": cmd.get("id"),
+                                "msg": {"channel": channel, "sid": sub.sid}})
+                    with self.subs_lock:
+                        if channel == "orderbook_delta":
+                            sub.since, books = self.server.feed.snapshots(tickers)
+                            for ticker, book in books.items():
+                                self._send_sequenced(sub, {
+                                    "type": "orderbook_snapshot",
+                                    "msg": dict(book, market_ticker=ticker),
+                                })
+                        self.subs.append(sub)
+        except (OSError, ValueError):
+            pass
+        finally:
+            self.closed.set()
+
+    def handle(self) -> None:
+        feed = self.server.feed
+        q = feed.subscribe()
+        threading.Thread(target=self._read_commands, daemon=True).start()
+        try:
+            while not self.closed.is_set() and feed.subscribed(q):
+                try:
+                    n, message = q.get(timeout=0.5)
+                except Empty:
+                    continue
+                channel = "ticker" if message["type"] == "ticker" else "orderbook_delta"
+                ticker = message["msg"]["market_ticker"]
+                with self.subs_lock:
+                    for sub in self.subs:
+                        if sub.channel != channel or ticker not in sub.tickers:
+                            continue
+                        if n <= sub.since:
+                            continue  # already in this subscription's snapshot
+                        if channel == "ticker":
+                            self._send(dict(message, sid=sub.sid))
+                        else:
+                            self._send_sequenced(sub, message)
+        except OSError:
+            pass
+        finally:
+            feed.unsubscribe(q)
+            # Wake the command reader (blocked on rfile) so the connection can close
+            try:
+                self.request.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class StreamServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, feed: Feed, gap_prob: float = 0.0) -> None:
+        super().__init__(address, StreamHandler)
+        self.feed = feed
+        self.gap_prob = gap_prob
+
+
+def make_rest_handler(feed: Feed):
+    class RestHandler(BaseHTTPRequestHandler):
+        def _reply(self, status: int, body: Dict) -> None:
+            data = json.dumps(body).encode()
+            self.send_response(status)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self) -> None:
+            url = urlparse(self.path)
+            parts = [p for p in url.path.split("/") if p]
+            if parts and parts[-1] == "markets":
+                query = parse_qs(url.query)
+                limit = int(query.get("limit", ["200"])[0])
+                start = int(query.get("cursor", ["0"])[0] or 0)
+                with feed.lock:
+                    page = [dict(m) for m in list(feed.markets.values())[start:start + limit]]
+                    more = start + limit < len(feed.markets)
+                self._reply(200, {"markets": page, "cursor": str(start + limit) if more else ""})
+            elif len(parts) >= 2 and parts[-1] == "orderbook":
+                book = feed.snapshot(parts[-2])
+                if book is None:
+                    self._reply(404, {"error": "not found"})
+                else:
+                    self._reply(200, {"orderbook": book})
+            elif len(parts) >= 2 and parts[-2] == "markets":
+                with feed.lock:
+                    market = feed.markets.get(parts[-1])
+                    market = dict(market) if market else None
+                if market is None:
+                    self._reply(404, {"error": "not found"})
+                else:
+                    self._reply(200, {"market": market})
+            else:
+                self._reply(404, {"error": "not found"})
+
+        def log_message(self, *_args) -> None:
+            pass
+
+    return RestHandler
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Local stand-in Kalshi feed")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--rest-port", type=int, default=8766)
+    parser.add_argument("--markets", type=int, default=200)
+    parser.add_argument("--rate", type=float, default=50.0, help="messages per second")
+    parser.add_argument("--gap-prob", type=float, default=0.0,
+                        help="probability of dropping a sequenced message")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    feed = Feed(args.markets, args.seed)
+    stop = threading.Event()
+    threading.Thread(target=feed.run, args=(args.rate, stop), daemon=True).start()
+
+    rest = ThreadingHTTPServer((args.host, args.rest_port), make_rest_handler(feed))
+    threading.Thread(target=rest.serve_forever, daemon=True).start()
+
+    stream = StreamServer((args.host, args.port), feed, gap_prob=args.gap_prob)
+    print(f"feed on {args.host}:{args.port}, REST on http://{args.host}:{args.rest_port}")
+    try:
+        stream.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop.set()
+        stream.server_close()
+        rest.shutdown()
+
+
+if __name__ == "__main__":
+    main()